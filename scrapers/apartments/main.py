@@ -5,13 +5,13 @@ CLI usage:
     python -m src.main --city "Atlanta" --state "GA" --max_pages 40 --target_phones 200 --delay 3.0 --headless true --output apartments_sfr.csv
 """
 import argparse
+import csv
+import itertools
 import logging
 import sys
 from pathlib import Path
 
-import pandas as pd
-
-from scrapers.apartments.scraper import scrape_city
+from scrapers.apartments.scraper import scrape_city, MAX_CONCURRENCY, STORAGE_STATE_PATH
 from src.store import Store
 
 logging.basicConfig(
@@ -20,6 +20,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Output CSV columns, in order
+CSV_COLUMNS = ['phone', 'manager_name', 'addresses', 'units']
+
 
 def parse_bool(value: str) -> bool:
     """Parse string boolean value."""
@@ -33,49 +36,41 @@ def export_to_csv(store: Store, output_path: str):
     """
     logger.info("Exporting data to CSV...")
     
-    # Get all phones with their data
-    phones_data = store.get_all_phones()
+    # Phones are aggregated and sorted by phone in SQL, streamed row by row
+    rows = store.export_rows()
+    first_row = next(rows, None)
     
-    if not phones_data:
+    if first_row is None:
         logger.warning("No data to export")
         return
 
-    # Prepare data for CSV
-    records = []
-    for data in phones_data:
-        # Join addresses with semicolon, deterministic order (sorted)
-        addresses_str = '; '.join(sorted(data['addresses'])) if data['addresses'] else ''
-        
-        # Use agent_name (fallback to manager_name for old data)
-        manager_name = data.get('agent_name') or data.get('manager_name') or ''
-        
-        records.append({
-            'phone': data['phone'],
-            'manager_name': manager_name,
-            'addresses': addresses_str,
-            'units': data['units']
-        })
-
-    # Create DataFrame and sort by phone ascending
-    df = pd.DataFrame(records)
-    df = df.sort_values(by='phone').reset_index(drop=True)
-
-    # Write to CSV
-    df.to_csv(output_path, index=False)
-    logger.info(f"Exported {len(records)} records to {output_path}")
+    record_count = 0
+    total_addresses = 0
+    preview = []
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        for row in itertools.chain([first_row], rows):
+            record = (row['phone'], row['agent_name'], row['addresses'], row['units'])
+            writer.writerow(record)
+            record_count += 1
+            total_addresses += row['units']
+            if len(preview) < 5:
+                preview.append(record)
+    logger.info(f"Exported {record_count} records to {output_path}")
     
     # Print summary
     print("\n" + "=" * 80)
     print("SCRAPING SUMMARY")
     print("=" * 80)
-    print(f"Unique phones found: {len(records)}")
-    
-    total_addresses = sum(len(data['addresses']) for data in phones_data)
+    print(f"Unique phones found: {record_count}")
     print(f"Total addresses aggregated: {total_addresses}")
     
     print("\nPreview (first 5 rows):")
     print("-" * 80)
-    print(df.head(5).to_string(index=False))
+    print("  ".join(CSV_COLUMNS))
+    for record in preview:
+        print("  ".join(str(value) for value in record))
     print("=" * 80)
     print(f"\nFull output saved to: {output_path}")
 
@@ -140,6 +135,24 @@ Examples:
         default='data/apartments_sfr.csv',
         help='Output CSV file path (default: data/apartments_sfr.csv)'
     )
+    parser.add_argument(
+        '--max_concurrency',
+        type=int,
+        default=MAX_CONCURRENCY,
+        help=f'Listing detail pages scraped at once (default: {MAX_CONCURRENCY})'
+    )
+    parser.add_argument(
+        '--storage_state',
+        type=str,
+        default=STORAGE_STATE_PATH,
+        help=f'Browser session file reused between runs; pass "" to disable (default: {STORAGE_STATE_PATH})'
+    )
+    parser.add_argument(
+        '--cdp_endpoint',
+        type=str,
+        default='',
+        help='CDP endpoint of a running Chrome to share between parallel scrapes instead of launching one (default: empty)'
+    )
     
     args = parser.parse_args()
     
@@ -162,6 +175,10 @@ Examples:
         logger.error("--delay must be non-negative")
         sys.exit(1)
     
+    if args.max_concurrency < 1:
+        logger.error("--max_concurrency must be at least 1")
+        sys.exit(1)
+    
     # Initialize store
     db_path = "data/data.db"
     store = Store(db_path)
@@ -178,6 +195,7 @@ Examples:
         logger.info(f"Headless: {headless}")
         logger.info(f"Proxy: {proxy or 'None'}")
         logger.info(f"Output: {args.output}")
+        logger.info(f"Max concurrency: {args.max_concurrency}")
         logger.info(f"Database: {db_path}")
         logger.info("=" * 80)
         
@@ -196,7 +214,10 @@ Examples:
             headless=headless,
             proxy=proxy,
             store=store,
-            output_path=args.output
+            output_path=args.output,
+            max_concurrency=args.max_concurrency,
+            storage_state=args.storage_state,
+            cdp_endpoint=args.cdp_endpoint.strip() or None
         )
         
         # Export to CSV
@@ -1,26 +1,272 @@
 """
 Apartments.com scraper with Playwright navigation and multi-fallback extraction.
 """
+import asyncio
+import csv
+import functools
 import json
 import logging
+import os
 import random
 import re
 import time
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterator, List, TextIO, Union
 from urllib.parse import urljoin, urlparse, urlunparse
 
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeoutError
+from bs4 import BeautifulSoup, SoupStrainer
+from playwright.async_api import async_playwright, Page, TimeoutError as PlaywrightTimeoutError
 
 from src.store import Store
 
+# lxml's C parser is much faster than html.parser; fall back if it isn't installed
+try:
+    from lxml import html as lxml_html
+    SOUP_PARSER = 'lxml'
+except ImportError:
+    lxml_html = None
+    SOUP_PARSER = 'html.parser'
+
+# lxml.cssselect (needs the cssselect package) compiles CSS selectors to XPath once, for the
+# detail-page snapshot when selectolax isn't installed
+try:
+    from lxml.cssselect import CSSSelector
+except ImportError:
+    CSSSelector = None
+
+# selectolax (lexbor) parses HTML and runs CSS selectors in C; BeautifulSoup is the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser as FastHTMLParser
+except ImportError:
+    FastHTMLParser = None
+
+# RE2 scans the page body in linear time; the stdlib engine is used if google-re2 isn't installed
+try:
+    import re2 as body_re
+except ImportError:
+    body_re = re
+
+# orjson parses JSON-LD several times faster; its JSONDecodeError subclasses json's.
+# It only accepts exact str, not the str subclasses lxml and BeautifulSoup return for text
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.apartments.com"
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+# Init script added to every context to hide automation
+STEALTH_JS = """
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined
+});
+"""
+# Listing detail pages scraped at once, each in its own browser context
+MAX_CONCURRENCY = 5
+# The incremental CSV export reruns after this many new phones, or this many seconds with new phones
+EXPORT_EVERY_PHONES = 25
+EXPORT_INTERVAL = 30.0
+# Seconds between detail workers' start-up
+WORKER_START_STAGGER = 0.1
+# Cookies/localStorage saved after search pages load, reused on the next run
+STORAGE_STATE_PATH = 'data/apartments_state.json'
+# City name -> URL slug in one pass: spaces to hyphens, commas and apostrophes dropped
+_CITY_TABLE = str.maketrans({' ': '-', ',': None, "'": None})
+
+# Search results pagination nav, and every link get_next_page_url considers:
+# "Next" arrows anywhere on the page plus all links inside the pagination nav
+PAGINATION_NAV_SELECTOR = 'nav[aria-label*="Search Results" i], nav.paging, nav#paging'
+NEXT_ARROW_SELECTOR = 'a[aria-label*="Next" i]'
+PAGINATION_NAV_LINK_SELECTOR = ', '.join(f'{nav} a' for nav in PAGINATION_NAV_SELECTOR.split(', '))
+PAGINATION_LINK_SELECTOR = f'{NEXT_ARROW_SELECTOR}, {PAGINATION_NAV_LINK_SELECTOR}'
+# Page number in a result page path such as /houses/atlanta-ga/2/
+PAGE_PATH_RE = re.compile(r'/(\d+)/?$')
+
+# Listing links in search results (HTML fallback when JSON-LD has none)
+LISTING_LINK_SELECTOR = 'article.placard a.property-link, a.property-link, article.placard a[href*="/"]'
+# The BeautifulSoup fallbacks only build the tags they read: JSON-LD scripts, and
+# placard articles plus links for LISTING_LINK_SELECTOR
+JSON_LD_STRAINER = SoupStrainer('script', type='application/ld+json')
+LISTING_LINK_STRAINER = SoupStrainer(['article', 'a'])
+# Detail page URL: https://www.apartments.com/<address-slug>/<id> - at least two path
+# segments, and not a search, blog, guide or other site section
+LISTING_URL_RE = re.compile(
+    rf'^{re.escape(BASE_URL)}/'
+    r'(?!.*(?:houses|blog|local-guide|sitemap|grow|about|parks-and-recreation))'
+    r'[^/]+(?:/[^/]+)+$'
+)
+
+# Requests the extractors never need: static assets and third-party analytics beacons.
+# Stylesheets still load - the visible-text reads and ready waits check visibility, which depends on CSS
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+BLOCKED_URL_KEYWORDS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'segment.io',
+    'segment.com',
+    'optimizely.com',
+    'hotjar.com',
+)
 
+# Elements likely to hold a phone number, checked in order
+PHONE_CONTAINER_SELECTORS = (
+    'a[href*="phone"]',
+    'a[href*="call"]',
+    '[class*="contact"]',
+    '[class*="phone"]',
+    '[class*="call"]',
+    '[id*="contact"]',
+    '[id*="phone"]',
+    '[data-testid*="phone"]',
+    '[data-testid*="contact"]',
+)
+# A JSON-LD block without any of these keys has nothing for parse_json_ld, so it is not decoded
+JSON_LD_FIELD_MARKERS = ('"address"', '"telephone"', '"name"')
+# Street suffixes and directionals kept upper-case by normalize_address
+_STREET_SUFFIXES = frozenset({'ST', 'AVE', 'RD', 'BLVD', 'LN', 'CT', 'DR', 'WAY', 'PL', 'PKWY'})
+_DIR_ABBREV = frozenset({'N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW'})
+# Any of these becoming visible means a search page / detail page has rendered
+SEARCH_READY_SELECTOR = ', '.join((
+    ".placard",
+    "[data-testid*='placard']",
+    'article.placard',
+    'a.property-link',
+))
+DETAIL_READY_SELECTOR = ', '.join((
+    'address',
+    'h1',
+    '[data-testid*="address"]',
+    '.property-header',
+    '.listing-details',
+))
+# Any of these in the DOM means the contact details have rendered on a detail page
+PHONE_READY_SELECTOR = 'a[href^="tel:"], [data-testid*="phone" i], [class*="phone" i]'
+PHONE_READY_TIMEOUT = 3000  # ms
+# Elements whose text may be the street address, checked in order
+ADDRESS_SELECTORS = (
+    '[data-testid*="address"]',
+    '[data-testid*="Address"]',
+    '[class*="address"]',
+    '[class*="Address"]',
+)
+# Non-empty innerText of visible matches for each selector in order, replacing
+# query_selector_all plus is_visible/inner_text round-trips per element
+VISIBLE_TEXTS_JS = """
+(selectors) => {
+    const out = [];
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            const rect = el.getBoundingClientRect();
+            if (!rect.width || !rect.height || getComputedStyle(el).visibility === 'hidden') {
+                continue;
+            }
+            const text = el.innerText;
+            if (text) {
+                out.push(text);
+            }
+        }
+    }
+    return out;
+}
+"""
+# Just the inputs of the cheapest extraction methods: JSON-LD block texts, tel: hrefs,
+# and the streetAddress meta / first <address> - a few KB instead of the whole page HTML
+QUICK_FIELDS_JS = """
+() => {
+    const meta = document.querySelector('meta[itemprop="streetAddress"]');
+    const address = document.querySelector('address');
+    return {
+        jsonLd: Array.from(document.querySelectorAll('script[type="application/ld+json"]'), (s) => s.textContent),
+        tel: Array.from(document.querySelectorAll('a[href^="tel:"]'), (a) => a.getAttribute('href')),
+        streetAddress: meta ? meta.getAttribute('content') : null,
+        address: address ? address.innerText : null,
+    };
+}
+"""
+# Everything the extractors read from the live page, in one evaluate call:
+# body text, visible phone-container and h1 texts, and the document title
+LISTING_TEXTS_JS = """
+({phoneSelectors, headingSelectors}) => {
+    const visible = (selectors) => {
+        const out = [];
+        for (const selector of selectors) {
+            for (const el of document.querySelectorAll(selector)) {
+                const rect = el.getBoundingClientRect();
+                if (!rect.width || !rect.height || getComputedStyle(el).visibility === 'hidden') {
+                    continue;
+                }
+                const text = el.innerText;
+                if (text) {
+                    out.push(text);
+                }
+            }
+        }
+        return out;
+    };
+    return {
+        body: document.body ? document.body.innerText : '',
+        phone: visible(phoneSelectors),
+        headings: visible(headingSelectors),
+        title: document.title,
+    };
+}
+"""
+
+# Every ASCII byte except 0-9, deleted by bytes.translate when normalizing phones
+NON_DIGIT_BYTES = bytes(c for c in range(128) if not 48 <= c <= 57)
 
-def retry_goto(page: Page, url: str, max_retries: int = 5) -> bool:
+# Extraction patterns, compiled once at import
+# Patterns run over the whole page body use RE2 when available (inline flags work in both engines)
+PHONE_RE = body_re.compile(r'(?:\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}')
+# Street number + common suffix
+STREET_RE = body_re.compile(r'(?i)\d+\s+[A-Za-z0-9\s]+(?:St|Street|Ave|Avenue|Rd|Road|Dr|Drive|Blvd|Boulevard|Ln|Lane|Ct|Court|Way|Pl|Place|Pkwy|Parkway)')
+LEADING_NUMBER_RE = re.compile(r'^\d+')
+# Labels that precede a manager name, in priority order, found in one pass. Only the labels are
+# scanned - a name capture in the same alternation would run on and swallow any later label
+MANAGER_LABELS = ('managed by', 'leasing office', 'property management', 'community')
+MANAGER_LABEL_RE = body_re.compile(rf'(?i)({"|".join(MANAGER_LABELS)})[:\s]+')
+# The name after a label, matched at the label's end
+MANAGER_NAME_RE = re.compile(r'[A-Z][a-zA-Z\s&,.-]+', re.IGNORECASE)
+MANAGER_SUFFIX_RE = re.compile(r'\s+(LLC|Inc|Corp|Management|Properties).*$', re.IGNORECASE)
+# Headings that are a zip code or a street address rather than a name
+ZIP_RE = re.compile(r'\d{5}')
+STREET_HEADING_RE = re.compile(r'^\d+\s+[A-Za-z\s]+(?:St|Street|Ave|Avenue)')
+# Page title up to the first "-" or "|", minus generic prefixes
+TITLE_NAME_RE = re.compile(r'^([^-|]+)')
+TITLE_PREFIX_RE = re.compile(r'^(Apartments?|Rentals?|Homes?|Properties?)\s+', re.IGNORECASE)
+
+# Attributes of each pagination candidate, read in one evaluate call.
+# Page numbers (from the link text or data-page) are parsed page-side; null if not numeric.
+PAGINATION_LINKS_JS = """
+(links, navSelector) => {
+    const pageNumber = (value) => /^\\d+$/.test(value || '') ? parseInt(value, 10) : null;
+    return links.map((el) => {
+        const text = (el.innerText || '').trim();
+        return {
+            href: el.getAttribute('href'),
+            text: text,
+            number: pageNumber(text),
+            aria_label: (el.getAttribute('aria-label') || '').toLowerCase(),
+            data_page: pageNumber((el.getAttribute('data-page') || '').trim()),
+            active: el.classList.contains('active'),
+            in_nav: !!el.closest(navSelector),
+        };
+    });
+}
+"""
+
+
+async def wait_for_network_idle(page: Page, timeout: int) -> None:
+    """Wait until the page's network goes quiet, giving up silently after timeout ms."""
+    try:
+        await page.wait_for_load_state('networkidle', timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass
+
+
+async def retry_goto(page: Page, url: str, max_retries: int = 5) -> bool:
     """
     Retry page.goto() with incremental backoff (2s, 4s, 8s, 16s).
     Returns True if successful, False if all retries failed.
@@ -36,9 +282,10 @@ def retry_goto(page: Page, url: str, max_retries: int = 5) -> bool:
             for wait_strategy in wait_strategies:
                 try:
                     # Add longer timeout for HTTP2 issues
-                    page.goto(url, wait_until=wait_strategy, timeout=120000)
-                    # Wait a bit more for any dynamic content
-                    page.wait_for_timeout(3000)
+                    await page.goto(url, wait_until=wait_strategy, timeout=120000)
+                    # Weaker strategies: wait for dynamic content to settle (networkidle already has)
+                    if wait_strategy != 'networkidle':
+                        await wait_for_network_idle(page, 3000)
                     return True
                 except Exception as e:
                     last_error = e
@@ -47,8 +294,8 @@ def retry_goto(page: Page, url: str, max_retries: int = 5) -> bool:
                     if 'http2' in error_str or 'protocol' in error_str:
                         try:
                             # Try with commit wait strategy (less strict)
-                            page.goto(url, wait_until='commit', timeout=120000)
-                            page.wait_for_timeout(5000)  # Longer wait for content
+                            await page.goto(url, wait_until='commit', timeout=120000)
+                            await wait_for_network_idle(page, 5000)  # Longer wait for content
                             return True
                         except Exception:
                             pass
@@ -61,7 +308,7 @@ def retry_goto(page: Page, url: str, max_retries: int = 5) -> bool:
             if attempt < max_retries - 1:
                 delay = backoff_delays[min(attempt, len(backoff_delays) - 1)]
                 logger.warning(f"Failed to load {url} (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {delay}s...")
-                time.sleep(delay)
+                await asyncio.sleep(delay)
             else:
                 logger.error(f"Failed to load {url} after {max_retries} attempts: {e}")
                 return False
@@ -77,8 +324,8 @@ def normalize_phone(phone: str) -> Optional[str]:
     if not phone:
         return None
     
-    # Remove all non-digit characters
-    digits = re.sub(r'\D', '', phone)
+    # Remove all non-digit characters (non-ASCII ones are dropped by the encode)
+    digits = phone.encode('ascii', 'ignore').translate(None, NON_DIGIT_BYTES).decode('ascii')
     
     # Accept 10 or 11 digits (11 if starts with 1)
     if len(digits) == 10:
@@ -89,9 +336,116 @@ def normalize_phone(phone: str) -> Optional[str]:
     return None
 
 
-def parse_json_ld(soup: BeautifulSoup) -> Dict:
+def json_ld_script_texts(html: str) -> List[str]:
     """
-    Parse all <script type="application/ld+json"> blocks.
+    Text of every <script type="application/ld+json"> block in the page HTML.
+    Uses an lxml XPath when available, skipping the BeautifulSoup tree entirely.
+    Texts are plain str, which orjson requires.
+    """
+    if lxml_html is not None:
+        return lxml_html.fromstring(html).xpath('//script[@type="application/ld+json"]/text()', smart_strings=False)
+    soup = BeautifulSoup(html, SOUP_PARSER, parse_only=JSON_LD_STRAINER)
+    return [str(script.string) for script in soup.find_all('script', type='application/ld+json') if script.string]
+
+
+def select_hrefs(html: str, selector: str) -> List[Optional[str]]:
+    """href of every element matching the CSS selector, parsed with selectolax when available."""
+    if FastHTMLParser is not None:
+        return [node.attributes.get('href') for node in FastHTMLParser(html).css(selector)]
+    soup = BeautifulSoup(html, SOUP_PARSER, parse_only=LISTING_LINK_STRAINER)
+    return [link.get('href') for link in soup.select(selector)]
+
+
+# Parsed detail-page HTML handed to the extractors: a selectolax tree, else an lxml tree
+# queried through compiled selectors, else BeautifulSoup
+Snapshot = Union['FastHTMLParser', 'lxml_html.HtmlElement', BeautifulSoup]
+
+
+def parse_snapshot(html: str) -> Snapshot:
+    """Parse a detail page once for the extractors, using the fastest parser that is installed and succeeds."""
+    if FastHTMLParser is not None:
+        try:
+            return FastHTMLParser(html)
+        except Exception as e:
+            logger.debug(f"selectolax could not parse page, falling back: {e}")
+    if CSSSelector is not None:
+        try:
+            return lxml_html.fromstring(html)
+        except Exception as e:
+            logger.debug(f"lxml could not parse page, falling back to BeautifulSoup: {e}")
+    return BeautifulSoup(html, SOUP_PARSER)
+
+
+@functools.lru_cache(maxsize=None)
+def compiled_selector(selector: str) -> 'CSSSelector':
+    """CSS selector compiled to XPath on first use, then reused for every page."""
+    return CSSSelector(selector)
+
+
+def is_lxml_tree(tree: Snapshot) -> bool:
+    """Whether the snapshot came from the lxml parser."""
+    return lxml_html is not None and isinstance(tree, lxml_html.HtmlElement)
+
+
+def snapshot_attrs(tree: Snapshot, selector: str, attr: str) -> List[Optional[str]]:
+    """Value of attr on every element matching the CSS selector."""
+    if isinstance(tree, BeautifulSoup):
+        return [elem.get(attr) for elem in tree.select(selector)]
+    if is_lxml_tree(tree):
+        return [elem.get(attr) for elem in compiled_selector(selector)(tree)]
+    return [node.attributes.get(attr) for node in tree.css(selector)]
+
+
+def snapshot_texts(tree: Snapshot, selector: str, separator: str = '') -> List[str]:
+    """Text of every element matching the CSS selector, stripped pieces joined by separator."""
+    if isinstance(tree, BeautifulSoup):
+        return [elem.get_text(separator, strip=True) for elem in tree.select(selector)]
+    if is_lxml_tree(tree):
+        return [
+            separator.join(piece.strip() for piece in elem.itertext() if piece.strip())
+            for elem in compiled_selector(selector)(tree)
+        ]
+    return [node.text(separator=separator, strip=True) for node in tree.css(selector)]
+
+
+def snapshot_html(tree: Snapshot) -> str:
+    """Serialized HTML of the snapshot."""
+    if isinstance(tree, BeautifulSoup):
+        return str(tree)
+    if is_lxml_tree(tree):
+        return lxml_html.tostring(tree, encoding='unicode')
+    return tree.html
+
+
+def iter_json_ld_objects(html: str, markers: tuple = (), script_texts: Optional[List[str]] = None) -> Iterator[Dict]:
+    """
+    Yield every object in the page's JSON-LD blocks, parsing each block once.
+    Top-level arrays are flattened; blocks that fail to parse are skipped.
+    If markers are given, blocks containing none of them are skipped without being decoded.
+    Block texts already read from the page can be passed as script_texts instead of html.
+    """
+    if script_texts is None:
+        script_texts = json_ld_script_texts(html)
+    for script_text in script_texts:
+        if not script_text:
+            continue
+        if markers and not any(marker in script_text for marker in markers):
+            continue
+        try:
+            data = json_loads(str(script_text))
+        except json.JSONDecodeError as e:
+            logger.debug(f"Error parsing JSON-LD: {e}")
+            continue
+        
+        # Handle both single objects and arrays
+        for item in (data if isinstance(data, list) else [data]):
+            if isinstance(item, dict):
+                yield item
+
+
+def parse_json_ld(html: str, script_texts: Optional[List[str]] = None) -> Dict:
+    """
+    Parse all <script type="application/ld+json"> blocks (or the given block texts).
     Returns dict with address, telephone, and name if found.
     """
     result = {
@@ -100,155 +454,134 @@ def parse_json_ld(soup: BeautifulSoup) -> Dict:
         'name': None
     }
     
-    json_ld_scripts = soup.find_all('script', type='application/ld+json')
-    
-    for script in json_ld_scripts:
+    for item in iter_json_ld_objects(html, JSON_LD_FIELD_MARKERS, script_texts):
         try:
-            content = script.string
-            if not content:
-                continue
+            # Extract address
+            if 'address' in item:
+                addr = item['address']
+                if isinstance(addr, dict):
+                    # Build full address from components
+                    parts = []
+                    if 'streetAddress' in addr:
+                        parts.append(addr['streetAddress'])
+                    if 'addressLocality' in addr:
+                        parts.append(addr['addressLocality'])
+                    if 'addressRegion' in addr:
+                        parts.append(addr['addressRegion'])
+                    if 'postalCode' in addr:
+                        parts.append(addr['postalCode'])
+                    if parts:
+                        result['address'] = ', '.join(parts)
+                elif isinstance(addr, str):
+                    result['address'] = addr
             
-            # Parse JSON-LD
-            data = json.loads(content)
+            # Extract telephone
+            if 'telephone' in item:
+                tel = item['telephone']
+                if isinstance(tel, str):
+                    result['telephone'] = tel
+                elif isinstance(tel, list) and tel:
+                    result['telephone'] = tel[0]
             
-            # Handle both single objects and arrays
-            if isinstance(data, list):
-                data_list = data
-            else:
-                data_list = [data]
+            # Extract name
+            if 'name' in item:
+                result['name'] = item['name']
             
-            for item in data_list:
-                # Extract address
-                if 'address' in item:
-                    addr = item['address']
-                    if isinstance(addr, dict):
-                        # Build full address from components
-                        parts = []
-                        if 'streetAddress' in addr:
-                            parts.append(addr['streetAddress'])
-                        if 'addressLocality' in addr:
-                            parts.append(addr['addressLocality'])
-                        if 'addressRegion' in addr:
-                            parts.append(addr['addressRegion'])
-                        if 'postalCode' in addr:
-                            parts.append(addr['postalCode'])
-                        if parts:
-                            result['address'] = ', '.join(parts)
-                    elif isinstance(addr, str):
-                        result['address'] = addr
-                
-                # Extract telephone
-                if 'telephone' in item:
-                    tel = item['telephone']
-                    if isinstance(tel, str):
-                        result['telephone'] = tel
-                    elif isinstance(tel, list) and tel:
-                        result['telephone'] = tel[0]
-                
-                # Extract name
-                if 'name' in item:
-                    result['name'] = item['name']
-                
-                # Also check for nested objects (e.g., RealEstateAgent)
-                if 'realEstateAgent' in item:
-                    agent = item['realEstateAgent']
-                    if isinstance(agent, dict):
-                        if 'telephone' in agent and not result['telephone']:
-                            tel = agent['telephone']
-                            if isinstance(tel, str):
-                                result['telephone'] = tel
-                        if 'name' in agent and not result['name']:
-                            result['name'] = agent['name']
-                
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            # Also check for nested objects (e.g., RealEstateAgent)
+            if 'realEstateAgent' in item:
+                agent = item['realEstateAgent']
+                if isinstance(agent, dict):
+                    if 'telephone' in agent and not result['telephone']:
+                        tel = agent['telephone']
+                        if isinstance(tel, str):
+                            result['telephone'] = tel
+                    if 'name' in agent and not result['name']:
+                        result['name'] = agent['name']
+            
+            # All three fields filled - no need to decode the remaining blocks
+            if result['address'] and result['telephone'] and result['name']:
+                return result
+        except (KeyError, TypeError) as e:
             logger.debug(f"Error parsing JSON-LD: {e}")
             continue
     
     return result
 
 
-def extract_phone_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[str]:
-    """Extract phone using multiple selector fallbacks."""
-    # Method 1: tel: links
+async def visible_texts(page: Page, selectors) -> List[str]:
+    """Text of every visible element matching each selector in turn, read in one evaluate call."""
+    return await page.evaluate(VISIBLE_TEXTS_JS, list(selectors))
+
+
+async def read_body_text(page: Page, tree: Snapshot) -> str:
+    """Visible text of the page body, falling back to the snapshot's text."""
     try:
-        tel_links = page.query_selector_all('a[href^="tel:"]')
-        for link in tel_links:
-            href = link.get_attribute('href')
-            if href:
-                phone = href.replace('tel:', '').replace('+1', '').strip()
-                normalized = normalize_phone(phone)
-                if normalized:
-                    return normalized
+        return await page.inner_text('body')
     except Exception:
-        pass
-    
-    # Also try with BeautifulSoup
-    if soup:
-        tel_links = soup.find_all('a', href=re.compile(r'^tel:'))
-        for link in tel_links:
-            href = link.get('href', '')
-            phone = href.replace('tel:', '').replace('+1', '').strip()
+        return '\n'.join(snapshot_texts(tree, 'body', '\n')) if tree is not None else ""
+
+
+async def read_listing_texts(page: Page) -> Optional[Dict]:
+    """
+    Body text, phone-container texts, h1 texts and title of the page in a single round-trip.
+    Returns None if the evaluate fails, leaving each extractor to read the page itself.
+    """
+    try:
+        return await page.evaluate(LISTING_TEXTS_JS, {
+            'phoneSelectors': list(PHONE_CONTAINER_SELECTORS),
+            'headingSelectors': ['h1'],
+        })
+    except Exception as e:
+        logger.debug(f"Could not read listing texts in one call: {e}")
+        return None
+
+
+async def extract_phone_from_selectors(page: Page, tree: Snapshot, page_texts: Optional[Dict] = None) -> Optional[str]:
+    """Extract phone using multiple selector fallbacks."""
+    # Method 1: tel: links, read from the HTML snapshot (the live page only when there is none)
+    if tree is not None:
+        for href in snapshot_attrs(tree, 'a[href^="tel:"]', 'href'):
+            phone = (href or '').replace('tel:', '').replace('+1', '').strip()
             normalized = normalize_phone(phone)
             if normalized:
                 return normalized
+    else:
+        try:
+            tel_links = await page.query_selector_all('a[href^="tel:"]')
+            for link in tel_links:
+                href = await link.get_attribute('href')
+                if href:
+                    phone = href.replace('tel:', '').replace('+1', '').strip()
+                    normalized = normalize_phone(phone)
+                    if normalized:
+                        return normalized
+        except Exception:
+            pass
     
-    # Method 2: Look for phone patterns in likely elements
+    # Method 2: Look for phone patterns in likely elements, read in one page-side call
     try:
-        likely_selectors = [
-            'a[href*="phone"]',
-            'a[href*="call"]',
-            '[class*="contact"]',
-            '[class*="phone"]',
-            '[class*="call"]',
-            '[id*="contact"]',
-            '[id*="phone"]',
-            '[data-testid*="phone"]',
-            '[data-testid*="contact"]',
-        ]
-        
-        for selector in likely_selectors:
-            try:
-                elements = page.query_selector_all(selector)
-                for elem in elements:
-                    try:
-                        if elem.is_visible():
-                            text = elem.inner_text()
-                            if text:
-                                # Try regex pattern
-                                phone_pattern = r'(?:\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}'
-                                matches = re.findall(phone_pattern, text)
-                                for match in matches:
-                                    normalized = normalize_phone(match)
-                                    if normalized:
-                                        return normalized
-                    except Exception:
-                        continue
-            except Exception:
-                continue
+        texts = page_texts['phone'] if page_texts else await visible_texts(page, PHONE_CONTAINER_SELECTORS)
+        for text in texts:
+            # Try regex pattern
+            for match in PHONE_RE.findall(text):
+                normalized = normalize_phone(match)
+                if normalized:
+                    return normalized
     except Exception:
         pass
     
     return None
 
 
-def extract_phone_from_regex(page: Page, soup: BeautifulSoup) -> Optional[str]:
+async def extract_phone_from_regex(page: Page, tree: Snapshot, body_text: Optional[str] = None) -> Optional[str]:
     """Extract phone using regex fallback on page text."""
-    page_text = ""
-    
-    try:
-        page_text = page.inner_text('body')
-    except Exception:
-        if soup:
-            page_text = soup.get_text()
+    page_text = body_text if body_text is not None else await read_body_text(page, tree)
     
     if not page_text:
         return None
     
     # Phone regex pattern
-    phone_pattern = r'(?:\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}'
-    matches = re.findall(phone_pattern, page_text)
-    
-    for match in matches:
+    for match in PHONE_RE.findall(page_text):
         normalized = normalize_phone(match)
         if normalized:
             return normalized
@@ -256,42 +589,77 @@ def extract_phone_from_regex(page: Page, soup: BeautifulSoup) -> Optional[str]:
     return None
 
 
-def extract_phone(page: Page, soup: BeautifulSoup) -> Optional[str]:
+async def extract_phone(page: Page, tree: Snapshot, body_text: Optional[str] = None, json_ld_data: Optional[Dict] = None, page_texts: Optional[Dict] = None) -> Optional[str]:
     """Extract phone using JSON-LD → selectors → regex fallback order."""
     # Method 1: JSON-LD
-    json_ld_data = parse_json_ld(soup)
+    if json_ld_data is None:
+        json_ld_data = parse_json_ld(snapshot_html(tree))
     if json_ld_data.get('telephone'):
         normalized = normalize_phone(json_ld_data['telephone'])
         if normalized:
             return normalized
     
     # Method 2: Selectors
-    phone = extract_phone_from_selectors(page, soup)
+    phone = await extract_phone_from_selectors(page, tree, page_texts)
     if phone:
         return phone
     
     # Method 3: Regex fallback
-    phone = extract_phone_from_regex(page, soup)
+    phone = await extract_phone_from_regex(page, tree, body_text)
     if phone:
         return phone
     
     return None
 
 
-def extract_address_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[str]:
-    """Extract address using multiple selector fallbacks."""
+def street_from_address_text(text: str) -> Optional[str]:
+    """Street part of an <address> block's text: first line, up to the first comma."""
+    if text and len(text) > 10:
+        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        if lines:
+            return lines[0].split(',')[0].strip() or None
+    return None
+
+
+def extract_address_from_snapshot(tree: Snapshot) -> Optional[str]:
+    """Run the address selector fallbacks against the parsed HTML snapshot, no browser round-trips."""
     # Method 1: meta itemprop=streetAddress
-    if soup:
-        street_elem = soup.find('meta', itemprop='streetAddress')
-        if street_elem and street_elem.get('content'):
-            addr = street_elem.get('content').strip()
-            if addr:
-                return addr
+    for content in snapshot_attrs(tree, 'meta[itemprop="streetAddress"]', 'content')[:1]:
+        addr = (content or '').strip()
+        if addr:
+            return addr
+    
+    # Method 2: address tag
+    for text in snapshot_texts(tree, 'address', '\n'):
+        addr = street_from_address_text(text)
+        if addr:
+            return addr
     
+    # Method 3: data-testid/class containing "Address"
+    for selector in ADDRESS_SELECTORS:
+        for text in snapshot_texts(tree, selector, ' ')[:1]:
+            # Check if it looks like an address (has street number)
+            if len(text) > 10 and len(text) < 200 and LEADING_NUMBER_RE.search(text):
+                return text
+    
+    return None
+
+
+async def extract_address_from_selectors(page: Page, tree: Snapshot) -> Optional[str]:
+    """
+    Extract address using multiple selector fallbacks.
+    The HTML snapshot is checked first; the live page is only queried if it yields nothing.
+    """
+    if tree is not None:
+        addr = extract_address_from_snapshot(tree)
+        if addr:
+            return addr
+    
+    # Method 1: meta itemprop=streetAddress
     try:
-        meta_elem = page.query_selector('meta[itemprop="streetAddress"]')
+        meta_elem = await page.query_selector('meta[itemprop="streetAddress"]')
         if meta_elem:
-            content = meta_elem.get_attribute('content')
+            content = await meta_elem.get_attribute('content')
             if content and content.strip():
                 return content.strip()
     except Exception:
@@ -299,49 +667,27 @@ def extract_address_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[
     
     # Method 2: address tag
     try:
-        address_tags = page.query_selector_all('address')
+        address_tags = await page.query_selector_all('address')
         for tag in address_tags:
             try:
-                text = tag.inner_text()
-                if text and len(text) > 10:
-                    lines = [line.strip() for line in text.split('\n') if line.strip()]
-                    if lines:
-                        # Take first line, split by comma and take first part (street address)
-                        addr = lines[0].split(',')[0].strip()
-                        if addr:
-                            return addr
+                addr = street_from_address_text(await tag.inner_text())
+                if addr:
+                    return addr
             except Exception:
                 continue
     except Exception:
         pass
     
-    if soup:
-        address_tags = soup.find_all('address')
-        for tag in address_tags:
-            text = tag.get_text(strip=True)
-            if text and len(text) > 10:
-                lines = [line.strip() for line in text.split('\n') if line.strip()]
-                if lines:
-                    addr = lines[0].split(',')[0].strip()
-                    if addr:
-                        return addr
-    
     # Method 3: data-testid/class containing "Address"
     try:
-        selectors = [
-            '[data-testid*="address" i]',
-            '[data-testid*="Address"]',
-            '[class*="address" i]',
-            '[class*="Address"]',
-        ]
-        for selector in selectors:
+        for selector in ADDRESS_SELECTORS:
             try:
-                elem = page.query_selector(selector)
+                elem = await page.query_selector(selector)
                 if elem:
-                    text = elem.inner_text()
+                    text = await elem.inner_text()
                     if text and len(text) > 10 and len(text) < 200:
                         # Check if it looks like an address (has street number)
-                        if re.search(r'^\d+', text):
+                        if LEADING_NUMBER_RE.search(text):
                             return text.strip()
             except Exception:
                 continue
@@ -351,22 +697,15 @@ def extract_address_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[
     return None
 
 
-def extract_address_from_regex(page: Page, soup: BeautifulSoup) -> Optional[str]:
+async def extract_address_from_regex(page: Page, tree: Snapshot, body_text: Optional[str] = None) -> Optional[str]:
     """Extract address using regex fallback."""
-    page_text = ""
-    
-    try:
-        page_text = page.inner_text('body')
-    except Exception:
-        if soup:
-            page_text = soup.get_text()
+    page_text = body_text if body_text is not None else await read_body_text(page, tree)
     
     if not page_text:
         return None
     
     # Address regex: street number + common suffix
-    street_pattern = r'\d+\s+[A-Za-z0-9\s]+(?:St|Street|Ave|Avenue|Rd|Road|Dr|Drive|Blvd|Boulevard|Ln|Lane|Ct|Court|Way|Pl|Place|Pkwy|Parkway)'
-    matches = re.findall(street_pattern, page_text, re.IGNORECASE)
+    matches = STREET_RE.findall(page_text)
     if matches:
         # Take first match and normalize
         addr = matches[0].strip()
@@ -377,6 +716,7 @@ def extract_address_from_regex(page: Page, soup: BeautifulSoup) -> Optional[str]
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_address(address: str) -> str:
     """Normalize address: title case, collapse whitespace."""
     if not address:
@@ -390,20 +730,20 @@ def normalize_address(address: str) -> str:
     normalized_words = []
     for word in words:
         # Don't capitalize common abbreviations
-        if word.upper() in ['ST', 'AVE', 'RD', 'BLVD', 'LN', 'CT', 'DR', 'WAY', 'PL', 'PKWY']:
-            normalized_words.append(word.upper())
-        elif word.upper() in ['N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW']:
-            normalized_words.append(word.upper())
+        upper = word.upper()
+        if upper in _STREET_SUFFIXES or upper in _DIR_ABBREV:
+            normalized_words.append(upper)
         else:
             normalized_words.append(word.title())
     
     return ' '.join(normalized_words)
 
 
-def extract_address(page: Page, soup: BeautifulSoup) -> Optional[str]:
+async def extract_address(page: Page, tree: Snapshot, body_text: Optional[str] = None, json_ld_data: Optional[Dict] = None) -> Optional[str]:
     """Extract address using JSON-LD → selectors → regex fallback order."""
     # Method 1: JSON-LD
-    json_ld_data = parse_json_ld(soup)
+    if json_ld_data is None:
+        json_ld_data = parse_json_ld(snapshot_html(tree))
     if json_ld_data.get('address'):
         addr = json_ld_data['address']
         if addr:
@@ -411,125 +751,172 @@ def extract_address(page: Page, soup: BeautifulSoup) -> Optional[str]:
             return normalized
     
     # Method 2: Selectors
-    address = extract_address_from_selectors(page, soup)
+    address = await extract_address_from_selectors(page, tree)
     if address:
         return normalize_address(address)
     
     # Method 3: Regex fallback
-    address = extract_address_from_regex(page, soup)
+    address = await extract_address_from_regex(page, tree, body_text)
     if address:
         return normalize_address(address)
     
     return None
 
 
-def extract_manager_name_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[str]:
+async def extract_manager_name_from_selectors(page: Page, tree: Snapshot, body_text: Optional[str] = None, page_texts: Optional[Dict] = None) -> Optional[str]:
     """Extract manager name using selector fallbacks."""
-    page_text = ""
-    
-    try:
-        page_text = page.inner_text('body')
-    except Exception:
-        if soup:
-            page_text = soup.get_text()
+    page_text = body_text if body_text is not None else await read_body_text(page, tree)
     
     # Method 1: Look for labels "Managed by", "Leasing Office", etc.
-    manager_keywords = [
-        r'Managed by[:\s]+([A-Z][a-zA-Z\s&,.-]+)',
-        r'Leasing Office[:\s]+([A-Z][a-zA-Z\s&,.-]+)',
-        r'Property Management[:\s]+([A-Z][a-zA-Z\s&,.-]+)',
-        r'Community[:\s]+([A-Z][a-zA-Z\s&,.-]+)',
-    ]
+    # One scan records where each label first ends; names are then matched there in label priority order
+    first_end_by_label = {}
+    for match in MANAGER_LABEL_RE.finditer(page_text):
+        label = match.group(1).lower()
+        if label not in first_end_by_label and MANAGER_NAME_RE.match(page_text, match.end()):
+            first_end_by_label[label] = match.end()
+            if len(first_end_by_label) == len(MANAGER_LABELS):
+                break
     
-    for pattern in manager_keywords:
-        match = re.search(pattern, page_text, re.IGNORECASE)
-        if match:
-            name = match.group(1).strip()
+    for label in MANAGER_LABELS:
+        if label in first_end_by_label:
+            name = MANAGER_NAME_RE.match(page_text, first_end_by_label[label]).group(0).strip()
             # Clean up common suffixes
-            name = re.sub(r'\s+(LLC|Inc|Corp|Management|Properties).*$', '', name, flags=re.IGNORECASE)
+            name = MANAGER_SUFFIX_RE.sub('', name)
             if len(name) > 2 and len(name) < 80:
                 return name
     
     # Method 2: H1/H2 near address
     try:
-        h1_elements = page.query_selector_all('h1')
-        for h1 in h1_elements:
-            try:
-                if h1.is_visible():
-                    text = h1.inner_text().strip()
-                    # If it looks like a name (not an address, not too long)
-                    if (text and len(text) > 2 and len(text) < 80 and
-                        not re.search(r'\d{5}', text) and  # Not a zip code
-                        'apartments.com' not in text.lower() and
-                        not re.search(r'^\d+\s+[A-Za-z\s]+(?:St|Street|Ave|Avenue)', text)):  # Not an address
-                        return text
-            except Exception:
-                continue
+        texts = page_texts['headings'] if page_texts else await visible_texts(page, ('h1',))
+        for text in texts:
+            text = text.strip()
+            # If it looks like a name (not an address, not too long)
+            if (text and len(text) > 2 and len(text) < 80 and
+                not ZIP_RE.search(text) and  # Not a zip code
+                'apartments.com' not in text.lower() and
+                not STREET_HEADING_RE.search(text)):  # Not an address
+                return text
     except Exception:
         pass
     
-    if soup:
-        headers = soup.find_all(['h1', 'h2'])
-        for header in headers:
-            text = header.get_text(strip=True)
+    if tree is not None:
+        for text in snapshot_texts(tree, 'h1, h2'):
             if (text and len(text) > 2 and len(text) < 80 and
-                not re.search(r'\d{5}', text) and
+                not ZIP_RE.search(text) and
                 'apartments.com' not in text.lower() and
-                not re.search(r'^\d+\s+[A-Za-z\s]+(?:St|Street|Ave|Avenue)', text)):
+                not STREET_HEADING_RE.search(text)):
                 return text
     
     return None
 
 
-def extract_manager_name_from_regex(page: Page, soup: BeautifulSoup) -> Optional[str]:
+async def extract_manager_name_from_regex(page: Page, tree: Snapshot, page_texts: Optional[Dict] = None) -> Optional[str]:
     """Extract manager name using regex fallback."""
     # Get page title
     title_text = None
     try:
-        title_text = page.title()
+        title_text = page_texts['title'] if page_texts else await page.title()
     except Exception:
-        if soup:
-            title = soup.find('title')
-            if title:
-                title_text = title.get_text()
+        if tree is not None:
+            titles = snapshot_texts(tree, 'title')
+            if titles:
+                title_text = titles[0]
     
     if title_text:
         # Look for patterns like "Name - Apartments.com" or "Name | Apartments"
-        match = re.search(r'^([^-|]+)', title_text)
+        match = TITLE_NAME_RE.search(title_text)
         if match:
             name = match.group(1).strip()
             # Remove common prefixes
-            name = re.sub(r'^(Apartments?|Rentals?|Homes?|Properties?)\s+', '', name, flags=re.IGNORECASE)
+            name = TITLE_PREFIX_RE.sub('', name)
             if len(name) > 2 and len(name) < 80 and 'apartments.com' not in name.lower():
                 return name
     
     return None
 
 
-def extract_manager_name(page: Page, soup: BeautifulSoup) -> Optional[str]:
+async def extract_manager_name(page: Page, tree: Snapshot, body_text: Optional[str] = None, json_ld_data: Optional[Dict] = None, page_texts: Optional[Dict] = None) -> Optional[str]:
     """Extract manager name using JSON-LD → selectors → regex fallback order."""
     # Method 1: JSON-LD
-    json_ld_data = parse_json_ld(soup)
+    if json_ld_data is None:
+        json_ld_data = parse_json_ld(snapshot_html(tree))
     if json_ld_data.get('name'):
         name = json_ld_data['name']
         if name and len(name) > 2 and len(name) < 80:
             return name
     
     # Method 2: Selectors
-    name = extract_manager_name_from_selectors(page, soup)
+    name = await extract_manager_name_from_selectors(page, tree, body_text, page_texts)
     if name:
         return name
     
     # Method 3: Regex fallback
-    name = extract_manager_name_from_regex(page, soup)
+    name = await extract_manager_name_from_regex(page, tree, page_texts)
     if name:
         return name
     
     return None
 
 
+async def quick_listing_fields(page: Page) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Phone, address and manager name from JSON-LD and tel:/address elements, read in one small evaluate.
+    Returns None unless all three are found, in which case the full page HTML never needs to be fetched or parsed.
+    """
+    try:
+        quick = await page.evaluate(QUICK_FIELDS_JS)
+    except Exception as e:
+        logger.debug(f"Quick field read failed: {e}")
+        return None
+    
+    json_ld_data = parse_json_ld('', quick['jsonLd'])
+    
+    phone = normalize_phone(json_ld_data['telephone']) if json_ld_data.get('telephone') else None
+    for href in quick['tel']:
+        if phone:
+            break
+        phone = normalize_phone((href or '').replace('tel:', '').replace('+1', '').strip())
+    if not phone:
+        return None
+    
+    address = (json_ld_data.get('address') or (quick['streetAddress'] or '').strip()
+               or street_from_address_text(quick['address'] or ''))
+    name = json_ld_data.get('name')
+    if not address or not isinstance(name, str) or not 2 < len(name) < 80:
+        return None
+    
+    return {'phone': phone, 'address': normalize_address(address), 'manager_name': name}
+
+
+async def extract_listing_fields(page: Page, tree: Snapshot, html: str) -> Dict[str, Optional[str]]:
+    """
+    Extract phone, address and manager name from one JSON-LD parse and one read of the page's texts.
+    Address and manager name are only looked up when a phone was found, since listings without one are skipped.
+    """
+    json_ld_data = parse_json_ld(html)
+    page_texts = await read_listing_texts(page)
+    body_text = page_texts['body'] if page_texts else await read_body_text(page, tree)
+    
+    fields = {'phone': None, 'address': None, 'manager_name': None}
+    fields['phone'] = await extract_phone(page, tree, body_text, json_ld_data, page_texts)
+    if fields['phone']:
+        fields['address'] = await extract_address(page, tree, body_text, json_ld_data)
+        fields['manager_name'] = await extract_manager_name(page, tree, body_text, json_ld_data, page_texts)
+    return fields
+
+
+@functools.lru_cache(maxsize=10000)
 def normalize_url(url: str) -> str:
     """Normalize URL by removing query parameters."""
+    # Fast path for the Apartments.com URLs this module handles: plain string slicing, no full parse
+    if url.startswith(BASE_URL + '/'):
+        end = len(url)
+        for separator in ('?', '#'):
+            index = url.find(separator, 0, end)
+            if index != -1:
+                end = index
+        return url[:end].rstrip('/')
+    
     parsed = urlparse(url)
     normalized = urlunparse((
         parsed.scheme,
@@ -542,72 +929,59 @@ def normalize_url(url: str) -> str:
     return normalized.rstrip('/')
 
 
-def get_listing_urls_from_search_page(page: Page, url: str) -> List[str]:
+def absolute_url(href: str) -> str:
+    """Resolve an href against BASE_URL, skipping urljoin for root-relative and absolute links."""
+    if href.startswith('/') and not href.startswith('//'):
+        return BASE_URL + href
+    if href.startswith(('https://', 'http://')):
+        return href
+    return urljoin(BASE_URL, href)
+
+
+async def get_listing_urls_from_search_page(page: Page, url: str) -> List[str]:
     """
     Extract listing detail page URLs from a search results page.
     First tries to extract from JSON-LD structured data, then falls back to HTML parsing.
     Returns empty list if all retries fail.
     """
-    listing_urls = []
+    listing_urls: Dict[str, None] = {}  # insertion-ordered dict doubles as an ordered set
     
-    if not retry_goto(page, url, max_retries=3):
+    if not await retry_goto(page, url, max_retries=3):
         logger.warning(f"Failed to load search page {url} after all retries, continuing to next page")
-        return listing_urls
+        return []
     
     try:
-        # Wait for DOM to render - try multiple selectors
-        search_selectors = [
-            ".placard",
-            "[data-testid*='placard']",
-            'article.placard',
-            'a.property-link',
-        ]
-        
-        waited = False
-        for selector in search_selectors:
-            try:
-                page.wait_for_selector(selector, timeout=15000, state='visible')
-                waited = True
-                break
-            except PlaywrightTimeoutError:
-                continue
-        
-        if not waited:
+        # Wait for DOM to render - one wait for whichever selector shows up first
+        try:
+            await page.wait_for_selector(SEARCH_READY_SELECTOR, timeout=15000, state='visible')
+        except PlaywrightTimeoutError:
             logger.warning(f"None of the search selectors found on {url}, but continuing anyway")
         
-        # Additional wait for dynamic content
-        page.wait_for_timeout(2000)
+        # Additional wait for dynamic content - returns as soon as the page goes quiet
+        await wait_for_network_idle(page, 2000)
+        
+        # One content read serves both methods
+        html = await page.content()
         
         # Method 1: Extract from JSON-LD structured data (most reliable)
         try:
-            json_ld_scripts = page.query_selector_all('script[type="application/ld+json"]')
-            for script in json_ld_scripts:
+            for item in iter_json_ld_objects(html):
                 try:
-                    script_text = script.inner_text()
-                    if not script_text:
-                        continue
-                    
-                    data = json.loads(script_text)
-                    
-                    # Handle array of JSON-LD objects
-                    json_ld_items = data if isinstance(data, list) else [data]
-                    
-                    for item in json_ld_items:
-                        # Look for ItemList with itemListElement
-                        if item.get('@type') == 'CollectionPage' and 'mainEntity' in item:
-                            main_entity = item['mainEntity']
-                            if isinstance(main_entity, dict) and main_entity.get('@type') == 'ItemList':
-                                items = main_entity.get('itemListElement', [])
-                                for list_item in items:
-                                    if isinstance(list_item, dict) and 'item' in list_item:
-                                        item_data = list_item['item']
-                                        if isinstance(item_data, dict) and 'url' in item_data:
-                                            listing_url = item_data['url']
-                                            if listing_url and listing_url.startswith(BASE_URL):
-                                                normalized = normalize_url(listing_url)
-                                                if normalized and normalized not in listing_urls:
-                                                    listing_urls.append(normalized)
-                except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+                    # Look for ItemList with itemListElement
+                    if item.get('@type') == 'CollectionPage' and 'mainEntity' in item:
+                        main_entity = item['mainEntity']
+                        if isinstance(main_entity, dict) and main_entity.get('@type') == 'ItemList':
+                            items = main_entity.get('itemListElement', [])
+                            for list_item in items:
+                                if isinstance(list_item, dict) and 'item' in list_item:
+                                    item_data = list_item['item']
+                                    if isinstance(item_data, dict) and 'url' in item_data:
+                                        listing_url = item_data['url']
+                                        if listing_url and listing_url.startswith(BASE_URL):
+                                            normalized = normalize_url(listing_url)
+                                            if normalized:
+                                                listing_urls[normalized] = None
+                except (KeyError, TypeError, AttributeError) as e:
                     logger.debug(f"Error parsing JSON-LD script: {e}")
                     continue
         except Exception as e:
@@ -615,110 +989,112 @@ def get_listing_urls_from_search_page(page: Page, url: str) -> List[str]:
         
         # Method 2: Fall back to HTML parsing if JSON-LD didn't yield results
         if not listing_urls:
-            html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Find listing links - multiple selector patterns
-            link_selectors = [
-                'article.placard a.property-link',
-                'a.property-link',
-                'article.placard a[href*="/"]',
-            ]
-            
-            seen_urls = set()
-            for selector in link_selectors:
-                links = soup.select(selector)
-                for link in links:
-                    href = link.get('href')
-                    if href:
-                        full_url = urljoin(BASE_URL, href)
-                        normalized = normalize_url(full_url)
-                        
-                        # Check if it's a detail page URL (not a search/filter page)
-                        # Detail pages have pattern: https://www.apartments.com/<address-slug>/<id>/
-                        path = normalized.replace(BASE_URL, '').strip('/')
-                        path_parts = [p for p in path.split('/') if p]
-                        
-                        # Valid detail page: has at least 2 path segments (address + ID)
-                        # Exclude: /houses/, /blog/, /local-guide/, etc.
-                        excluded_paths = ['houses', 'blog', 'local-guide', 'sitemap', 'grow', 'about', 'parks-and-recreation']
-                        
-                        if (normalized not in seen_urls and
-                            normalized.startswith(BASE_URL) and
-                            len(path_parts) >= 2 and
-                            not any(excluded in path for excluded in excluded_paths) and
-                            path_parts[0] != 'houses'):
-                            seen_urls.add(normalized)
-                            listing_urls.append(normalized)
+            # Find listing links - all selector patterns in one query, document order
+            for href in select_hrefs(html, LISTING_LINK_SELECTOR):
+                if href:
+                    normalized = normalize_url(absolute_url(href))
+                    if normalized not in listing_urls and LISTING_URL_RE.match(normalized):
+                        listing_urls[normalized] = None
         
         logger.info(f"Found {len(listing_urls)} listings on search page")
         
     except Exception as e:
         logger.error(f"Error extracting listing URLs from search page {url}: {e}")
     
-    return listing_urls
+    return list(listing_urls)
+
+
+def _pagination_link_url(href: Optional[str]) -> Optional[str]:
+    """Absolute, normalized URL for a pagination href, or None for empty/'#' links."""
+    if href and href != '#':
+        return normalize_url(absolute_url(href))
+    return None
+
+
+async def _read_pagination_links(page: Page, selector: str) -> List[Dict]:
+    """Read every candidate's attributes in one page-side call."""
+    return await page.eval_on_selector_all(selector, PAGINATION_LINKS_JS, PAGINATION_NAV_SELECTOR)
+
+
+def _classify_pagination_links(links: List[Dict]) -> Dict[str, Optional[str]]:
+    """
+    Single pass over the candidate links, returning the next-page URL each method would pick:
+    - next_arrow: first link whose aria-label contains "Next" (Method 1)
+    - next_text: first pagination-nav link with text "Next" (Method 2)
+    - page_number: nav link for the current page number + 1 (Method 3)
+    """
+    next_arrow = None
+    arrow_seen = False
+    next_text = None
+    current_seen = False
+    current_number = None
+    by_page_number = {}
+    
+    for link in links:
+        if not arrow_seen and 'next' in link['aria_label']:
+            arrow_seen = True
+            next_arrow = _pagination_link_url(link['href'])
+        if not link['in_nav']:
+            continue
+        
+        url = _pagination_link_url(link['href'])
+        text = link['text']
+        if next_text is None and url and text.lower() == 'next':
+            next_text = url
+        # The current page is the active link or the one labelled "Current Page"
+        if not current_seen and (link['active'] or 'current' in link['aria_label']):
+            current_seen = True
+            current_number = link['number']
+        if url:
+            # A numbered link can be identified by its text, data-page or /<n>/ path
+            path_match = PAGE_PATH_RE.search(link['href'])
+            for number in (link['number'], link['data_page'], path_match and int(path_match.group(1))):
+                if number is not None:
+                    by_page_number.setdefault(number, url)
+    
+    page_number = None
+    if current_number is not None:
+        page_number = by_page_number.get(current_number + 1)
+    
+    return {'next_arrow': next_arrow, 'next_text': next_text, 'page_number': page_number}
+
+
+# Methods in priority order, with the narrowest selector that feeds each one
+_PAGINATION_METHODS = (
+    ('next_arrow', NEXT_ARROW_SELECTOR),
+    ('next_text', PAGINATION_NAV_LINK_SELECTOR),
+    ('page_number', PAGINATION_NAV_LINK_SELECTOR),
+)
 
+# Pagination markup is constant within a site, so remember which method worked per host
+_PAGINATION_METHOD_CACHE: Dict[str, tuple] = {}
 
-def get_next_page_url(page: Page) -> Optional[str]:
+
+async def get_next_page_url(page: Page) -> Optional[str]:
     """
     Extract the next page URL from pagination on the current page.
+    The method that worked last time for this host is tried first against only the
+    links it needs; otherwise all candidates are read with one compound query and a
+    single page-side evaluate, then classified in one pass and picked in priority order.
     Returns None if no next page is found.
     """
     try:
-        # Look for "Next" button/link using multiple methods
-        # Method 1: Look for aria-label containing "Next"
-        try:
-            next_link = page.query_selector('a[aria-label*="Next" i]')
-            if next_link:
-                href = next_link.get_attribute('href')
-                if href and href != '#':
-                    full_url = urljoin(BASE_URL, href)
-                    return normalize_url(full_url)
-        except Exception:
-            pass
+        host = urlparse(page.url).netloc
+        cached = _PAGINATION_METHOD_CACHE.get(host)
+        if cached:
+            name, selector = cached
+            next_url = _classify_pagination_links(await _read_pagination_links(page, selector))[name]
+            if next_url:
+                return next_url
+            # The markup changed (or this is the last page) - fall back to the full scan
+            del _PAGINATION_METHOD_CACHE[host]
         
-        # Method 2: Look for link with text "Next" in pagination nav
-        try:
-            nav = page.query_selector('nav[aria-label*="Search Results" i], nav.paging, nav#paging')
-            if nav:
-                # Find all links in nav
-                links = nav.query_selector_all('a')
-                for link in links:
-                    text = link.inner_text().strip()
-                    if text.lower() == 'next':
-                        href = link.get_attribute('href')
-                        if href and href != '#':
-                            full_url = urljoin(BASE_URL, href)
-                            return normalize_url(full_url)
-        except Exception:
-            pass
-        
-        # Method 3: Extract current page number and find next page link
-        try:
-            nav = page.query_selector('nav[aria-label*="Search Results" i], nav.paging, nav#paging')
-            if nav:
-                # Find the current page (active link or aria-label="Current Page")
-                current_page_elem = nav.query_selector('a.active, a[aria-label*="Current" i]')
-                if current_page_elem:
-                    current_text = current_page_elem.inner_text().strip()
-                    try:
-                        current_page = int(current_text)
-                        # Find link with next page number
-                        next_page = current_page + 1
-                        links = nav.query_selector_all('a')
-                        for link in links:
-                            link_text = link.inner_text().strip()
-                            link_data_page = link.get_attribute('data-page')
-                            if (link_text == str(next_page) or 
-                                (link_data_page and int(link_data_page) == next_page)):
-                                href = link.get_attribute('href')
-                                if href and href != '#':
-                                    full_url = urljoin(BASE_URL, href)
-                                    return normalize_url(full_url)
-                    except (ValueError, AttributeError):
-                        pass
-        except Exception:
-            pass
+        matches = _classify_pagination_links(await _read_pagination_links(page, PAGINATION_LINK_SELECTOR))
+        for method in _PAGINATION_METHODS:
+            next_url = matches[method[0]]
+            if next_url:
+                _PAGINATION_METHOD_CACHE[host] = method
+                return next_url
         
     except Exception as e:
         logger.debug(f"Error finding next page URL: {e}")
@@ -726,7 +1102,7 @@ def get_next_page_url(page: Page) -> Optional[str]:
     return None
 
 
-def scrape_listing_detail(page: Page, url: str, store: Store) -> Optional[Dict]:
+async def scrape_listing_detail(page: Page, url: str, store: Store) -> Optional[Dict]:
     """
     Scrape a single listing detail page and extract data.
     Returns None if all retries fail or no phone found.
@@ -739,52 +1115,40 @@ def scrape_listing_detail(page: Page, url: str, store: Store) -> Optional[Dict]:
         logger.debug(f"URL already crawled: {normalized_url}, skipping")
         return None
     
-    if not retry_goto(page, url, max_retries=3):
+    if not await retry_goto(page, url, max_retries=3):
         logger.warning(f"Failed to load listing detail page {url} after all retries, skipping")
         return None
     
     try:
-        # Wait for page to load
-        detail_selectors = [
-            'address',
-            'h1',
-            '[data-testid*="address"]',
-            '.property-header',
-            '.listing-details',
-            'body',
-        ]
-        
-        waited = False
-        for selector in detail_selectors:
-            try:
-                page.wait_for_selector(selector, timeout=10000, state='visible')
-                waited = True
-                break
-            except PlaywrightTimeoutError:
-                continue
-        
-        if not waited:
+        # Wait for page to load - one wait for whichever selector shows up first
+        try:
+            await page.wait_for_selector(DETAIL_READY_SELECTOR, timeout=10000, state='visible')
+        except PlaywrightTimeoutError:
             logger.warning(f"None of the detail selectors found on {url}, but continuing anyway")
         
-        # Additional wait for dynamic content
-        page.wait_for_timeout(1000)
-        
-        # Get page content for BeautifulSoup
-        html = page.content()
-        soup = BeautifulSoup(html, 'html.parser')
+        # Wait for the phone to render rather than sleeping a fixed time; short grace period if it never does
+        try:
+            await page.wait_for_selector(PHONE_READY_SELECTOR, timeout=PHONE_READY_TIMEOUT, state='attached')
+        except PlaywrightTimeoutError:
+            await page.wait_for_timeout(500)
         
-        # Extract phone (required)
-        phone = extract_phone(page, soup)
+        # Fast path: all fields from JSON-LD and tel:/address elements, without pulling the page HTML over CDP
+        fields = await quick_listing_fields(page)
+        if fields is None:
+            # Get page content and parse it once for every extractor
+            html = await page.content()
+            tree = parse_snapshot(html)
+            
+            # Phone (required), address and manager name (best-effort) in one extraction pass
+            fields = await extract_listing_fields(page, tree, html)
+        phone = fields['phone']
         if not phone:
             logger.debug(f"No phone found for {normalized_url}, skipping")
             store.mark_url_crawled(normalized_url)  # Mark as crawled even if no phone
             return None
         
-        # Extract address (best-effort)
-        address = extract_address(page, soup)
-        
-        # Extract manager name (best-effort)
-        manager_name = extract_manager_name(page, soup)
+        address = fields['address']
+        manager_name = fields['manager_name']
         
         logger.info(f"Extracted: {phone} - {address or 'N/A'} - {manager_name or 'N/A'}")
         
@@ -802,44 +1166,111 @@ def scrape_listing_detail(page: Page, url: str, store: Store) -> Optional[Dict]:
         return None
 
 
-def export_to_csv_incremental(store: Store, output_path: str):
+def export_to_csv_incremental(store: Store, output_file: TextIO):
     """
     Export aggregated data to CSV incrementally.
+    Rewrites the already-open output file in place so the scrape keeps one handle for the whole run.
     This is a standalone function to avoid circular imports.
     """
-    import pandas as pd
-    
-    # Get all phones with their data
-    phones_data = store.get_all_phones()
-    
-    if not phones_data:
-        return
-    
-    # Prepare data for CSV
-    records = []
-    for data in phones_data:
-        # Join addresses with semicolon, deterministic order (sorted)
-        addresses_str = '; '.join(sorted(data['addresses'])) if data['addresses'] else ''
-        
-        # Use agent_name (fallback to manager_name for old data)
-        manager_name = data.get('agent_name') or data.get('manager_name') or ''
-        
-        records.append({
-            'phone': data['phone'],
-            'manager_name': manager_name,
-            'addresses': addresses_str,
-            'units': data['units']
-        })
+    output_file.seek(0)
+    output_file.truncate()
+    writer = csv.writer(output_file)
+    writer.writerow(['phone', 'manager_name', 'addresses', 'units'])
+    # Rows come aggregated and sorted by phone from SQL
+    writer.writerows(
+        (row['phone'], row['agent_name'], row['addresses'], row['units'])
+        for row in store.export_rows()
+    )
+    output_file.flush()
+
+
+def scrape_city(
+    city: str,
+    state: str,
+    max_pages: int,
+    delay: float,
+    target_phones: int,
+    headless: bool,
+    proxy: Optional[str],
+    store: Store,
+    output_path: str = "apartments_sfr.csv",
+    max_concurrency: int = MAX_CONCURRENCY,
+    storage_state: str = STORAGE_STATE_PATH,
+    cdp_endpoint: Optional[str] = None
+) -> None:
+    """Synchronous entry point; runs scrape_city_async on a fresh event loop."""
+    asyncio.run(scrape_city_async(
+        city=city,
+        state=state,
+        max_pages=max_pages,
+        delay=delay,
+        target_phones=target_phones,
+        headless=headless,
+        proxy=proxy,
+        store=store,
+        output_path=output_path,
+        max_concurrency=max_concurrency,
+        storage_state=storage_state,
+        cdp_endpoint=cdp_endpoint
+    ))
+
+
+async def new_browser_context(browser, storage_state: Optional[str] = None):
+    """
+    Create a browser context with the scraper's headers and stealth script, blocking unneeded requests.
+    Starts from the session saved at storage_state when given.
+    """
+    context = await browser.new_context(
+        storage_state=storage_state,
+        user_agent=USER_AGENT,
+        viewport={'width': 1920, 'height': 1080},
+        locale='en-US',
+        timezone_id='America/New_York',
+        # Add stealth options
+        java_script_enabled=True,
+        bypass_csp=True,
+        ignore_https_errors=False,
+        extra_http_headers={
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate',  # Removed 'br' (Brotli) which requires HTTP/2
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Sec-Fetch-User': '?1',
+            'Cache-Control': 'max-age=0',
+        },
+    )
     
-    # Create DataFrame and sort by phone ascending
-    df = pd.DataFrame(records)
-    df = df.sort_values(by='phone').reset_index(drop=True)
+    # Add stealth script to hide automation
+    await context.add_init_script(STEALTH_JS)
     
-    # Write to CSV
-    df.to_csv(output_path, index=False)
+    await context.route('**/*', block_unneeded_requests)
+    return context
 
 
-def scrape_city(
+async def block_unneeded_requests(route):
+    """Abort asset and analytics requests; let everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(keyword in request.url for keyword in BLOCKED_URL_KEYWORDS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def save_storage_state(context, storage_state: str):
+    """Persist cookies and localStorage so the next run starts with a warm session."""
+    try:
+        os.makedirs(os.path.dirname(storage_state) or '.', exist_ok=True)
+        await context.storage_state(path=storage_state)
+        logger.debug(f"Saved browser session to {storage_state}")
+    except Exception as e:
+        logger.warning(f"Error saving browser session: {e}")
+
+
+async def scrape_city_async(
     city: str,
     state: str,
     max_pages: int,
@@ -848,87 +1279,88 @@ def scrape_city(
     headless: bool,
     proxy: Optional[str],
     store: Store,
-    output_path: str = "apartments_sfr.csv"
+    output_path: str = "apartments_sfr.csv",
+    max_concurrency: int = MAX_CONCURRENCY,
+    storage_state: str = STORAGE_STATE_PATH,
+    cdp_endpoint: Optional[str] = None
 ) -> None:
     """
     Main scraping function using Playwright.
-    Uses one browser + one context for the whole run.
-    Reuses resultsPage for search pagination and detailPage for visiting property links.
+    Uses one browser for the whole run - or, given cdp_endpoint, an already running Chrome
+    shared with other scrapes (e.g. other cities), in contexts of this run's own. Search pagination runs on one results page
+    (each next page comes from the current one), then up to max_concurrency listing
+    detail pages are scraped at once, each worker reusing its own page in its own context.
+    Every context starts from the session saved at storage_state (if any), which is
+    saved again after each search page that yields listings.
     """
-    logger.info(f"Starting scrape for {city}, {state} (max {max_pages} pages, target {target_phones} phones)")
+    logger.info(f"Starting scrape for {city}, {state} (max {max_pages} pages, target {target_phones} phones, {max_concurrency} workers)")
     
-    # Use one browser + one context for the whole run
-    with sync_playwright() as p:
+    # Use one browser for the whole run
+    async with async_playwright() as p:
         # Launch Chromium browser with options to reduce detection
         browser_options = {
             'headless': headless,
             'args': [
                 '--disable-blink-features=AutomationControlled',
-                '--disable-features=IsolateOrigins,site-per-process',
+                # Chromium only honours the last --disable-features flag, so keep them in one list
+                '--disable-features=IsolateOrigins,site-per-process,VizDisplayCompositor,Translate,BackForwardCache',
                 '--disable-site-isolation-trials',
                 '--disable-dev-shm-usage',
                 '--no-sandbox',
                 '--disable-setuid-sandbox',
                 '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
+                '--disable-gpu',
+                '--disable-background-networking',
+                '--blink-settings=imagesEnabled=false',  # Skip image decoding entirely
             ]
         }
         if proxy:
             browser_options['proxy'] = {'server': proxy}
         
-        # Launch one browser instance for the entire run
-        # Use Chrome instead of Chromium for better compatibility (like Zillow scraper)
-        try:
-            browser = p.chromium.launch(channel="chrome", headless=headless, args=browser_options['args'])
-            logger.info("Chrome browser launched")
-        except Exception:
-            # Fallback to Chromium if Chrome not available
-            browser = p.chromium.launch(**browser_options)
-            logger.info("Chromium browser launched")
+        if cdp_endpoint:
+            # Attach to a shared browser instead of launching one; closing it below only disconnects
+            browser = await p.chromium.connect_over_cdp(cdp_endpoint)
+            logger.info(f"Connected to shared browser at {cdp_endpoint}")
+            if proxy:
+                logger.warning("Proxy is ignored when connecting to a shared browser; set it when launching that browser")
+        else:
+            # Launch one browser instance for the entire run
+            # Use Chrome instead of Chromium for better compatibility (like Zillow scraper)
+            try:
+                browser = await p.chromium.launch(channel="chrome", headless=headless, args=browser_options['args'])
+                logger.info("Chrome browser launched")
+            except Exception:
+                # Fallback to Chromium if Chrome not available
+                browser = await p.chromium.launch(**browser_options)
+                logger.info("Chromium browser launched")
         
-        # Create one context for the entire run with enhanced headers
-        context = browser.new_context(
-            user_agent=USER_AGENT,
-            viewport={'width': 1920, 'height': 1080},
-            locale='en-US',
-            timezone_id='America/New_York',
-            # Add stealth options
-            java_script_enabled=True,
-            bypass_csp=True,
-            ignore_https_errors=False,
-            extra_http_headers={
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate',  # Removed 'br' (Brotli) which requires HTTP/2
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Cache-Control': 'max-age=0',
-            },
-        )
-        logger.info("Browser context created")
+        # Reuse a saved session so the first requests don't look like a cold visitor
+        has_saved_session = bool(storage_state) and os.path.exists(storage_state)
+        saved_session = storage_state if has_saved_session else None
+        if has_saved_session:
+            logger.info(f"Reusing saved browser session from {storage_state}")
         
-        # Add stealth script to hide automation
-        context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
+        # Search pages get their own context; each detail worker gets another so
+        # concurrent listings don't share one cookie jar
+        context = await new_browser_context(browser, saved_session)
+        results_page = await context.new_page()
+        detail_pages = []
+        for _ in range(max_concurrency):
+            detail_context = await new_browser_context(browser, saved_session)
+            detail_pages.append(await detail_context.new_page())
+        logger.info(f"Pages created - 1 results page and {len(detail_pages)} detail pages, reused for entire run")
         
-        # Reuse two pages for the entire run:
-        # - results_page: for navigating search result pages
-        # - detail_page: for visiting individual listing detail pages
-        results_page = context.new_page()
-        detail_page = context.new_page()
-        logger.info("Pages created - reusing for entire run")
+        # Keep the output CSV open for the run; each incremental export rewrites it in place
+        output_file = open(output_path, 'w', newline='', encoding='utf-8')
         
         try:
+            # Opening truncated the previous CSV - rewrite it from the store before the first throttled export
+            export_to_csv_incremental(store, output_file)
+            
             # Collect listing URLs from search pages
-            all_listing_urls = []
-            city_normalized = city.lower().replace(' ', '-').replace(',', '').replace("'", "")
+            # Ordered set: featured listings repeat across search pages but are scraped once
+            all_listing_urls: Dict[str, None] = {}
+            city_normalized = city.lower().translate(_CITY_TABLE)
             state_normalized = state.lower()  # Apartments.com uses lowercase state
             
             # Start with page 1 URL
@@ -944,23 +1376,26 @@ def scrape_city(
                 page_num += 1
                 logger.info(f"Fetching page {page_num}: {current_url}")
                 
-                listing_urls = get_listing_urls_from_search_page(results_page, current_url)
+                listing_urls = await get_listing_urls_from_search_page(results_page, current_url)
                 
                 if listing_urls:
-                    all_listing_urls.extend(listing_urls)
+                    all_listing_urls.update(dict.fromkeys(listing_urls))
                     logger.info(f"Found {len(listing_urls)} listings on page {page_num}, total so far: {len(all_listing_urls)}")
+                    # The session got through to real results - keep it for the next run
+                    if storage_state:
+                        await save_storage_state(context, storage_state)
                 else:
                     logger.warning(f"No listings found on page {page_num}, but continuing to next page")
                 
                 # Get next page URL from pagination on the current page
                 if page_num < max_pages:
-                    next_url = get_next_page_url(results_page)
+                    next_url = await get_next_page_url(results_page)
                     if next_url:
                         current_url = next_url
                         # Rate limiting with jitter
                         jitter = random.uniform(-0.6, 0.6)
                         wait_time = max(0.1, delay + jitter)
-                        time.sleep(wait_time)
+                        await asyncio.sleep(wait_time)
                     else:
                         logger.info("No next page found, stopping pagination")
                         break
@@ -969,56 +1404,77 @@ def scrape_city(
             
             logger.info(f"Total listing URLs collected: {len(all_listing_urls)}")
             
-            # Scrape each listing detail page
-            for i, listing_url in enumerate(all_listing_urls, 1):
-                # Stop if we've reached target phones
-                if store.get_unique_phones_count() >= target_phones:
-                    logger.info(f"Reached target of {target_phones} phones, stopping")
-                    break
-                
-                # Skip if already crawled (normalize first)
-                normalized_listing_url = normalize_url(listing_url)
-                if store.is_url_crawled(normalized_listing_url):
-                    logger.debug(f"Skipping already crawled URL: {normalized_listing_url}")
-                    continue
-                
-                logger.info(f"Scraping listing {i}/{len(all_listing_urls)}: {listing_url}")
-                
-                listing_data = scrape_listing_detail(detail_page, listing_url, store)
-                
-                if listing_data:
-                    phone = listing_data['phone']
-                    address = listing_data['address']
-                    manager_name = listing_data['manager_name']
+            # Workers pull listings from one shared iterator, so each URL is handed out once
+            listings = iter(enumerate(all_listing_urls, 1))
+            total_listings = len(all_listing_urls)
+            # Phone count and time of the last incremental CSV export
+            last_export_count = store.get_unique_phones_count()
+            last_export_time = time.monotonic()
+            
+            async def worker(worker_index: int, detail_page: Page):
+                nonlocal last_export_count, last_export_time
+                # Stagger start-up so the workers' first requests don't hit the site together
+                await asyncio.sleep(worker_index * WORKER_START_STAGGER)
+                for i, listing_url in listings:
+                    # Stop if we've reached target phones
+                    if store.get_unique_phones_count() >= target_phones:
+                        logger.info(f"Reached target of {target_phones} phones, stopping")
+                        return
                     
-                    # Upsert phone and manager name
-                    store.upsert_phone(phone, manager_name)
+                    # Skip if already crawled (collected URLs are already normalized and deduplicated)
+                    if store.is_url_crawled(listing_url):
+                        logger.debug(f"Skipping already crawled URL: {listing_url}")
+                        continue
                     
-                    # Add address if present
-                    if address:
-                        store.add_address(phone, address)
+                    logger.info(f"Scraping listing {i}/{total_listings}: {listing_url}")
                     
-                    logger.info(f"Progress: {store.get_unique_phones_count()}/{target_phones} unique phones")
+                    listing_data = await scrape_listing_detail(detail_page, listing_url, store)
                     
-                    # Export to CSV incrementally after each successful extraction
-                    # This ensures we have constant updates even if interrupted
-                    try:
-                        export_to_csv_incremental(store, output_path)
-                        logger.debug(f"CSV updated with {store.get_unique_phones_count()} phones")
-                    except Exception as e:
-                        logger.debug(f"Could not export CSV incrementally: {e}")
-                
-                # Rate limiting with jitter
-                if i < len(all_listing_urls):
-                    jitter = random.uniform(-0.6, 0.6)
-                    wait_time = max(0.1, delay + jitter)
-                    time.sleep(wait_time)
+                    if listing_data:
+                        phone = listing_data['phone']
+                        address = listing_data['address']
+                        manager_name = listing_data['manager_name']
+                        
+                        # Upsert phone and manager name
+                        store.upsert_phone(phone, manager_name)
+                        
+                        # Add address if present
+                        if address:
+                            store.add_address(phone, address)
+                        
+                        phones_count = store.get_unique_phones_count()
+                        logger.info(f"Progress: {phones_count}/{target_phones} unique phones")
+                        
+                        # Export to CSV incrementally, every EXPORT_EVERY_PHONES new phones or EXPORT_INTERVAL seconds,
+                        # so there are regular updates if interrupted without rewriting the file per listing
+                        new_phones = phones_count - last_export_count
+                        if new_phones >= EXPORT_EVERY_PHONES or (new_phones and time.monotonic() - last_export_time >= EXPORT_INTERVAL):
+                            try:
+                                export_to_csv_incremental(store, output_file)
+                                logger.debug(f"CSV updated with {phones_count} phones")
+                            except Exception as e:
+                                logger.debug(f"Could not export CSV incrementally: {e}")
+                            last_export_count = phones_count
+                            last_export_time = time.monotonic()
+                    
+                    # Rate limiting with jitter (per worker)
+                    if i < total_listings:
+                        jitter = random.uniform(-0.6, 0.6)
+                        wait_time = max(0.1, delay + jitter)
+                        await asyncio.sleep(wait_time)
+            
+            # Scrape listing detail pages concurrently
+            await asyncio.gather(*(worker(index, detail_page) for index, detail_page in enumerate(detail_pages)))
         
         finally:
-            # Clean up pages and browser
-            results_page.close()
-            detail_page.close()
-            browser.close()
+            # Final export picks up phones found since the last incremental one
+            try:
+                export_to_csv_incremental(store, output_file)
+            except Exception as e:
+                logger.debug(f"Could not export CSV: {e}")
+            # Clean up output file and browser (closing the browser closes every context and page;
+            # for a shared browser it closes this run's contexts and disconnects)
+            output_file.close()
+            await browser.close()
     
     logger.info("Scraping completed")
-
@@ -1,18 +1,30 @@
 #!/usr/bin/env python3
 """
 Human-like script to collect Zillow property URLs by clicking through property cards.
-Opens each property in a new tab and collects the URL from the address bar.
+Builds detail URLs from the zpid in each card's link; cards without one are opened
+in a new tab and the URL is collected from the address bar.
+Uses async Playwright so several property tabs can load at once.
 Filters for houses (single-family rentals) only.
 """
 import argparse
+import asyncio
 import csv
 import logging
+import os
 import random
+import re
 import time
-from typing import List, Set
+from pathlib import Path
+from typing import List, Optional, Set
 from urllib.parse import urlparse, urlunparse
 
-from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeoutError
+import httpx
+from playwright.async_api import async_playwright, Page, TimeoutError as PlaywrightTimeoutError
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:  # Optional: only used for very large URL histories
+    ScalableBloomFilter = None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -23,10 +35,236 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://www.zillow.com"
 # Use a more recent Chrome user agent
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+# Stealth init script shared by the Zillow scrapers, loaded from a file so both stay in sync
+STEALTH_JS_PATH = str(Path(__file__).parent / 'stealth.js')
+# City name -> URL slug in one pass: spaces to hyphens, commas and apostrophes dropped
+_CITY_TABLE = str.maketrans({' ': '-', ',': None, "'": None})
+# Number of property tabs opened concurrently per search page
+MAX_CONCURRENCY = 5
+# Number of search result pages fetched at once after the first page
+MAX_PARALLEL_PAGES = 3
+# Above this many known URLs, seen_urls becomes a Bloom filter (if pybloom_live is installed)
+SEEN_URLS_BLOOM_THRESHOLD = 100_000
+# Typical size of one row in the URL CSV, used to estimate its row count from the file size
+URL_ROW_BYTES = 80
+# Cookies/localStorage saved after a session has cleared Zillow's checks, reused on the next run
+STORAGE_STATE_PATH = 'data/zillow_state.json'
+# Status codes Zillow returns when it blocks a client
+BLOCKED_STATUS_CODES = (403, 429, 503)
+# Resource types never needed for collecting URLs
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+# Property tabs only read the URL and title, so styles can go too
+DETAIL_BLOCKED_RESOURCE_TYPES = BLOCKED_RESOURCE_TYPES | {'stylesheet'}
+# Property cards on a search results page, and the links inside them
+CARD_SELECTOR = '[data-test="property-card"], [data-testid="property-card"]'
+CARD_LINK_SELECTOR = ', '.join(
+    f'{card} a[href*="{path}"]'
+    for card in CARD_SELECTOR.split(', ')
+    for path in ('homedetails', '/b/')
+)
+# Zillow renders at most this many property cards on one search results page
+SEARCH_PAGE_SIZE = 41
+ZPID_RE = re.compile(r'/(\d+)_zpid')
+# Normalized property detail URL (/homedetails/ or /b/ with a zpid)
+_VALID_DETAIL_RE = re.compile(r'^https://www\.zillow\.com/(?:homedetails|b)/[^?]*\d+_zpid')
+
+# Zillow's press-and-hold challenge button
+CHALLENGE_SELECTORS = (
+    'button[data-testid*="challenge"]',
+    'button:has-text("Press & Hold")',
+    'button:has-text("Press and Hold")',
+    '[class*="challenge"] button',
+    '[id*="challenge"] button',
+    'button[aria-label*="Press"]',
+    'button[aria-label*="Hold"]',
+    'button[class*="Press"]',
+    'button[class*="Hold"]',
+)
+
+# Buttons that open the search filter panel
+FILTER_OPEN_SELECTORS = (
+    'button[data-test="filter-button"]',
+    'button:has-text("Filters")',
+    '[data-test="filter-panel-toggle"]',
+    'button[aria-label*="Filter"]',
+)
+
+# House (single-family) option inside the filter panel
+HOUSE_SELECTORS = (
+    # Checkbox/button with "House" text
+    'input[type="checkbox"][value*="house" i]',
+    'input[type="checkbox"][value*="1"]',  # Sometimes house is value 1
+    'label:has-text("House") input[type="checkbox"]',
+    'button[aria-label*="House" i]',
+    'button:has-text("House")',
+    '[data-test*="house" i]',
+    '[data-test*="property-type"] button:has-text("House")',
+    '[data-test*="property-type"] input[value*="house" i]',
+    # Look for property type section
+    'text=House',
+    'text=Single Family',
+)
+
+# Page-side scan for the house option inside filter sections.
+# Runs in one evaluate call, tags the best match with a data-found-house marker
+# and returns a selector for it (or null).
+FIND_HOUSE_FILTER_JS = """
+([exact, phrase, marker]) => {
+    const contextWords = ['property type', 'filter', 'apartment', 'condo'];
+    const sections = document.querySelectorAll('[class*="filter"], [data-test*="filter"], [id*="filter"]');
+    for (const section of sections) {
+        for (const el of section.querySelectorAll('button, input, label')) {
+            const text = (el.innerText || '').toLowerCase().trim();
+            // Must be exactly "house" or contain "house" with property type context
+            if (!(text === exact || (text.startsWith(exact) && text.length < 20) || text.includes(phrase))) {
+                continue;
+            }
+            const container = el.closest('div, section, form');
+            const containerText = ((container && container.textContent) || '').toLowerCase();
+            if (contextWords.some((word) => containerText.includes(word))) {
+                el.setAttribute(marker, '1');
+                return {selector: '[' + marker + '="1"]', text: text};
+            }
+        }
+    }
+    return null;
+}
+"""
+
+
+# Page-side scroll loop: steps down the page until it stops growing at the bottom.
+# Replaces one evaluate round-trip per scroll step with a single call. Once at the
+# bottom it re-probes with exponential backoff and stops after two identical probes.
+# Steps one viewport at a time unless `step` is given, and stops early once
+# `maxCards` cards have rendered (a full page - no more can load).
+SCROLL_TO_BOTTOM_JS = """
+async ({step, delay, maxSteps, maxBackoff, cardSelector, maxCards}) => {
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    const stepPx = step || window.innerHeight;
+    let height = document.body.scrollHeight;
+    let stable = 0;
+    let backoff = delay;
+    for (let i = 0; i < maxSteps; i++) {
+        window.scrollBy(0, stepPx);
+        await sleep(delay);
+        if (maxCards && document.querySelectorAll(cardSelector).length >= maxCards) {
+            break;
+        }
+        const newHeight = document.body.scrollHeight;
+        if (newHeight !== height) {
+            stable = 0;
+            backoff = delay;
+            height = newHeight;
+            continue;
+        }
+        if (window.innerHeight + window.scrollY < newHeight - 2) {
+            continue;
+        }
+        if (++stable >= 2) {
+            break;
+        }
+        backoff = Math.min(backoff * 1.6, maxBackoff);
+        await sleep(backoff);
+    }
+    return {
+        height: height,
+        cards: document.querySelectorAll(cardSelector).length,
+    };
+}
+"""
+
+
+# Page-side read of every card's link and position, replacing several
+# query_selector/get_attribute/bounding_box round-trips per card.
+# `link` follows the preference order homedetails > /b/ > card link > any anchor.
+CARD_DATA_JS = """
+(cards) => cards.map((card) => {
+    const first = card.querySelector('a[href*="homedetails"], a[href*="/b/"]');
+    let link = null;
+    for (const selector of ['a[href*="homedetails"]', 'a[href*="/b/"]', 'a[data-test*="property-card-link"]', 'a']) {
+        const a = card.querySelector(selector);
+        const href = a && a.getAttribute('href');
+        if (href && (href.includes('/b/') || href.includes('homedetails')) && !href.includes('/browse/') && href.includes('zpid')) {
+            link = href;
+            break;
+        }
+    }
+    const rect = card.getBoundingClientRect();
+    return {
+        href: first && first.getAttribute('href'),
+        link: link,
+        x: rect.x,
+        y: rect.y,
+        width: rect.width,
+        height: rect.height,
+    };
+})
+"""
+
+# Tag, checked state and selection attributes of a filter element in one call
+ELEMENT_STATE_JS = """
+(el) => ({
+    tag: el.tagName.toLowerCase(),
+    checked: !!el.checked,
+    pressed: el.getAttribute('aria-pressed'),
+    className: (el.getAttribute('class') || '').toLowerCase(),
+})
+"""
+
+
+# Human-like "scroll down, pause, scroll back up a little" in one evaluate call
+SCROLL_DOWN_AND_BACK_JS = """
+async ({down, up, pause}) => {
+    window.scrollTo(0, down);
+    await new Promise((resolve) => setTimeout(resolve, pause));
+    window.scrollTo(0, up);
+}
+"""
+
+# Challenge checks run inside the page so only a boolean / a length crosses CDP, not the whole page text
+PAGE_MENTIONS_ANY_JS = """
+(keywords) => {
+    const haystack = [
+        document.documentElement.outerHTML,
+        document.title,
+        document.body ? document.body.innerText : '',
+    ].join(' ').toLowerCase();
+    return keywords.some((keyword) => haystack.includes(keyword));
+}
+"""
+BODY_TEXT_LENGTH_JS = "() => document.body ? document.body.innerText.trim().length : 0"
+
+
+def canonical_detail_url(zpid: str) -> str:
+    """Build the canonical detail page URL for a Zillow property id."""
+    return f"{BASE_URL}/homedetails/{zpid}_zpid/"
+
+
+def seen_keys(url: str) -> tuple:
+    """A URL plus its canonical zpid form, so either spelling is recognized later."""
+    match = ZPID_RE.search(url)
+    if match:
+        return (url, canonical_detail_url(match.group(1)))
+    return (url,)
+
+
+def mark_seen(seen_urls, url: str):
+    """Record a URL under all of its seen_keys."""
+    for key in seen_keys(url):
+        seen_urls.add(key)
 
 
 def normalize_url(url: str) -> str:
     """Normalize URL by removing query parameters and fragments."""
+    # Fast path for the Zillow URLs this module handles: plain string slicing, no full parse
+    if url.startswith(BASE_URL + '/'):
+        end = len(url)
+        for separator in ('?', '#'):
+            index = url.find(separator, 0, end)
+            if index != -1:
+                end = index
+        return url[:end].rstrip('/')
+    
     parsed = urlparse(url)
     normalized = urlunparse((
         parsed.scheme,
@@ -39,35 +277,24 @@ def normalize_url(url: str) -> str:
     return normalized.rstrip('/')
 
 
-def detect_and_handle_challenge(page: Page, headless: bool) -> bool:
+async def detect_and_handle_challenge(page: Page, headless: bool) -> bool:
     """
     Detect and handle Zillow's press-and-hold anti-bot challenge.
     Returns True if challenge was detected and handled, False otherwise.
     """
     try:
         # Wait a bit for page to fully load
-        time.sleep(2)
+        await asyncio.sleep(2)
         
-        # Common selectors for Zillow's press-and-hold challenge
-        challenge_selectors = [
-            'button[data-testid*="challenge"]',
-            'button:has-text("Press & Hold")',
-            'button:has-text("Press and Hold")',
-            '[class*="challenge"] button',
-            '[id*="challenge"] button',
-            'button[aria-label*="Press"]',
-            'button[aria-label*="Hold"]',
-            'button[class*="Press"]',
-            'button[class*="Hold"]',
-        ]
+        card_locator = page.locator(CARD_SELECTOR)
         
         # Check for challenge button
         challenge_button = None
-        for selector in challenge_selectors:
+        for selector in CHALLENGE_SELECTORS:
             try:
-                elements = page.query_selector_all(selector)
+                elements = await page.query_selector_all(selector)
                 for elem in elements:
-                    if elem.is_visible():
+                    if await elem.is_visible():
                         challenge_button = elem
                         logger.warning("⚠️  Press-and-hold challenge detected!")
                         break
@@ -79,26 +306,18 @@ def detect_and_handle_challenge(page: Page, headless: bool) -> bool:
         # Also check page content for challenge indicators
         if not challenge_button:
             try:
-                page_text = page.content().lower()
-                page_title = page.title().lower()
-                body_text = ""
-                try:
-                    body_text = page.inner_text('body').lower()
-                except:
-                    pass
-                
-                # Check for challenge keywords
+                # Check for challenge keywords in the HTML, title and body text
                 challenge_keywords = ['press', 'hold', 'verify', 'human', 'bot']
-                has_challenge_text = any(kw in page_text or kw in page_title or kw in body_text for kw in challenge_keywords)
+                has_challenge_text = await page.evaluate(PAGE_MENTIONS_ANY_JS, challenge_keywords)
                 
                 if has_challenge_text:
                     # Look for any button on the page
-                    all_buttons = page.query_selector_all('button')
+                    all_buttons = await page.query_selector_all('button')
                     for btn in all_buttons:
                         try:
-                            if btn.is_visible():
-                                btn_text = btn.inner_text().lower()
-                                btn_aria = (btn.get_attribute('aria-label') or '').lower()
+                            if await btn.is_visible():
+                                btn_text = (await btn.inner_text()).lower()
+                                btn_aria = (await btn.get_attribute('aria-label') or '').lower()
                                 # Check if button text or aria-label contains challenge keywords
                                 if any(kw in btn_text or kw in btn_aria for kw in ['press', 'hold', 'verify']):
                                     challenge_button = btn
@@ -112,11 +331,10 @@ def detect_and_handle_challenge(page: Page, headless: bool) -> bool:
         # Also check if no property cards are visible but page loaded (might be challenge blocking)
         if not challenge_button:
             try:
-                cards = page.query_selector_all('[data-test="property-card"], [data-testid="property-card"]')
-                if not cards or len(cards) == 0:
+                if await card_locator.count() == 0:
                     # Check if page seems empty or blocked
-                    body_text = page.inner_text('body')
-                    if body_text and len(body_text.strip()) < 500:  # Very short content might indicate challenge
+                    body_length = await page.evaluate(BODY_TEXT_LENGTH_JS)
+                    if body_length and body_length < 500:  # Very short content might indicate challenge
                         logger.warning("⚠️  Page appears to have very little content - might be blocked by challenge")
                         logger.warning("   Please check the browser window for any challenges")
             except:
@@ -127,7 +345,7 @@ def detect_and_handle_challenge(page: Page, headless: bool) -> bool:
                 logger.error("❌ Challenge detected but running in headless mode!")
                 logger.error("   Please run WITHOUT --headless flag to manually solve the challenge.")
                 logger.error("   Waiting 30 seconds...")
-                time.sleep(30)
+                await asyncio.sleep(30)
                 return False
             else:
                 logger.warning("=" * 80)
@@ -154,48 +372,44 @@ def detect_and_handle_challenge(page: Page, headless: bool) -> bool:
                         # Check if challenge button is still visible
                         if challenge_button:
                             try:
-                                if not challenge_button.is_visible():
+                                if not await challenge_button.is_visible():
                                     logger.info("✅ Challenge button disappeared - appears to be solved!")
-                                    time.sleep(3)  # Wait a bit more for page to update
+                                    await asyncio.sleep(3)  # Wait a bit more for page to update
                                     break
                             except:
                                 # Button might have been removed from DOM
                                 logger.info("✅ Challenge button removed from DOM - appears to be solved!")
-                                time.sleep(3)
+                                await asyncio.sleep(3)
                                 break
                         
                         # Check if property cards have appeared (indicates challenge passed)
-                        cards = page.query_selector_all('[data-test="property-card"], [data-testid="property-card"]')
-                        if cards and len(cards) > 0:
+                        if await card_locator.count() > 0:
                             logger.info("✅ Challenge solved! Property cards are visible.")
                             return True
                         
                         # Check if page content changed significantly
                         try:
-                            current_body = page.inner_text('body')
-                            if current_body and len(current_body.strip()) > 1000:  # More content = likely passed
-                                cards = page.query_selector_all('[data-test="property-card"], [data-testid="property-card"]')
-                                if cards:
+                            if await page.evaluate(BODY_TEXT_LENGTH_JS) > 1000:  # More content = likely passed
+                                if await card_locator.count() > 0:
                                     logger.info("✅ Challenge appears solved - page has more content now.")
                                     return True
                         except:
                             pass
                         
-                        time.sleep(2)
+                        await asyncio.sleep(2)
                     except Exception as e:
                         logger.debug(f"Error checking challenge status: {e}")
-                        time.sleep(2)
+                        await asyncio.sleep(2)
                 
                 # Final check
-                cards = page.query_selector_all('[data-test="property-card"], [data-testid="property-card"]')
-                if cards and len(cards) > 0:
+                if await card_locator.count() > 0:
                     logger.info("✅ Challenge solved! Property cards are visible.")
                     return True
                 else:
                     logger.warning("⚠️  Timeout waiting for challenge. Please check browser window manually.")
                     logger.warning("   If challenge is still visible, solve it and the script will continue.")
                     logger.warning("   Waiting additional 30 seconds...")
-                    time.sleep(30)
+                    await asyncio.sleep(30)
                     return True
         
         return False
@@ -204,29 +418,41 @@ def detect_and_handle_challenge(page: Page, headless: bool) -> bool:
         return False
 
 
-def human_like_scroll(page: Page, scroll_pause: float = 1.0):
+async def human_jitter():
+    """Short random pause between actions; only there to avoid a perfectly regular cadence."""
+    await asyncio.sleep(random.uniform(0.1, 0.3))
+
+
+async def wait_for_network_idle(page: Page, timeout: int = 5000):
+    """Wait for the page's network to go quiet, giving up silently after timeout ms."""
+    try:
+        await page.wait_for_load_state('networkidle', timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass
+
+
+async def human_like_scroll(page: Page, scroll_pause: float = 1.0):
     """Scroll the page in a human-like manner with random pauses."""
-    # Get page height
-    page_height = page.evaluate("document.body.scrollHeight")
+    # Get page height; the viewport never changes, so read it once
+    page_height = await page.evaluate("document.body.scrollHeight")
     viewport_height = page.viewport_size['height']
     
     # Scroll in chunks with random pauses
     current_position = 0
     scroll_amount = random.randint(300, 600)  # Random scroll amount
     
-    while current_position < page_height:
+    while current_position < page_height - viewport_height:
         # Random pause before scrolling
-        time.sleep(random.uniform(0.5, scroll_pause))
+        await asyncio.sleep(random.uniform(0.5, scroll_pause))
         
-        # Scroll
+        # Scroll and read back the page height in the same call
         current_position += scroll_amount
-        page.evaluate(f"window.scrollTo(0, {current_position})")
+        new_height = await page.evaluate("y => { window.scrollTo(0, y); return document.body.scrollHeight; }", current_position)
         
         # Random pause after scrolling (mimic reading time)
-        time.sleep(random.uniform(0.8, 1.5))
+        await asyncio.sleep(random.uniform(0.8, 1.5))
         
         # Update page height (in case new content loaded)
-        new_height = page.evaluate("document.body.scrollHeight")
         if new_height > page_height:
             page_height = new_height
         
@@ -234,117 +460,78 @@ def human_like_scroll(page: Page, scroll_pause: float = 1.0):
         if random.random() < 0.1:  # 10% chance
             back_scroll = random.randint(100, 300)
             current_position = max(0, current_position - back_scroll)
-            page.evaluate(f"window.scrollTo(0, {current_position})")
-            time.sleep(random.uniform(0.3, 0.7))
+            await page.evaluate(f"window.scrollTo(0, {current_position})")
+            await asyncio.sleep(random.uniform(0.3, 0.7))
 
 
-def filter_for_houses(page: Page):
+async def filter_for_houses(page: Page):
     """Filter search results to show only houses (single-family rentals)."""
     try:
         logger.info("Filtering for houses (single-family rentals)...")
         
         # Wait for filters to load
-        time.sleep(random.uniform(1.0, 2.0))
-        
-        # Look for filter panel/button that opens filters
-        filter_open_selectors = [
-            'button[data-test="filter-button"]',
-            'button:has-text("Filters")',
-            '[data-test="filter-panel-toggle"]',
-            'button[aria-label*="Filter"]',
-        ]
+        await page.wait_for_load_state('domcontentloaded')
+        await human_jitter()
         
         # Try to open filter panel if it exists
-        for selector in filter_open_selectors:
+        for selector in FILTER_OPEN_SELECTORS:
             try:
-                filter_button = page.query_selector(selector)
-                if filter_button and filter_button.is_visible():
+                filter_button = page.locator(selector).first
+                if await filter_button.is_visible():
                     logger.info("Opening filter panel...")
-                    filter_button.click()
-                    time.sleep(random.uniform(1.0, 1.5))
+                    await filter_button.click()
+                    await human_jitter()
                     break
             except Exception:
                 continue
         
-        # Now look for the house filter option - try multiple strategies
-        house_selectors = [
-            # Checkbox/button with "House" text
-            'input[type="checkbox"][value*="house" i]',
-            'input[type="checkbox"][value*="1"]',  # Sometimes house is value 1
-            'label:has-text("House") input[type="checkbox"]',
-            'button[aria-label*="House" i]',
-            'button:has-text("House")',
-            '[data-test*="house" i]',
-            '[data-test*="property-type"] button:has-text("House")',
-            '[data-test*="property-type"] input[value*="house" i]',
-            # Look for property type section
-            'text=House',
-            'text=Single Family',
-        ]
-        
         # Try to find and click house filter
-        for selector in house_selectors:
+        filter_match = None
+        filter_scanned = False
+        for selector in HOUSE_SELECTORS:
             try:
                 # Try query_selector first
-                house_element = page.query_selector(selector)
-                
+                house_element = await page.query_selector(selector)
+
                 if not house_element:
-                    # Try to find by text content - but only in filter areas
-                    # Look for filter sections/panels first
-                    filter_sections = page.query_selector_all('[class*="filter"], [data-test*="filter"], [id*="filter"]')
-                    
-                    for section in filter_sections:
+                    # Try to find by text content - but only in filter areas.
+                    # The scan runs page-side in a single call, and only once per invocation.
+                    if not filter_scanned:
+                        filter_scanned = True
                         try:
-                            # Look for "House" text within filter sections
-                            house_options = section.query_selector_all('button, input, label, a')
-                            for elem in house_options:
-                                try:
-                                    text = elem.inner_text().lower().strip()
-                                    # Must be exactly "house" or contain "house" with property type context
-                                    if (text == 'house' or 
-                                        (text.startswith('house') and len(text) < 20) or
-                                        'single family' in text):
-                                        tag = elem.evaluate('el => el.tagName.toLowerCase()')
-                                        if tag in ['button', 'input', 'label']:
-                                            # Make sure it's in a filter context
-                                            parent_text = elem.evaluate('el => el.closest("div, section, form")?.textContent?.toLowerCase() || ""')
-                                            if 'property type' in parent_text or 'filter' in parent_text or 'apartment' in parent_text or 'condo' in parent_text:
-                                                house_element = elem
-                                                logger.info(f"Found house filter in filter section: {text}")
-                                                break
-                                except Exception:
-                                    continue
-                            if house_element:
-                                break
-                        except Exception:
-                            continue
-                
+                            filter_match = await page.evaluate(FIND_HOUSE_FILTER_JS, ['house', 'single family', 'data-found-house'])
+                        except Exception as e:
+                            logger.debug(f"Error scanning filter sections: {e}")
+                    if filter_match and filter_match.get('selector'):
+                        house_element = await page.query_selector(filter_match['selector'])
+                        if house_element:
+                            logger.info(f"Found house filter in filter section: {filter_match.get('text')}")
+
                 if house_element:
                     try:
-                        # Check if it's already selected
-                        if house_element.evaluate('el => el.tagName.toLowerCase()') == 'input':
-                            is_checked = house_element.is_checked()
-                            if is_checked:
+                        # Check if it's already selected (tag, checked state and classes in one call)
+                        state = await house_element.evaluate(ELEMENT_STATE_JS)
+                        if state['tag'] == 'input':
+                            if state['checked']:
                                 logger.info("House filter already selected")
                                 return True
                             else:
                                 logger.info(f"Clicking house filter checkbox: {selector}")
-                                house_element.check()
-                                time.sleep(random.uniform(1.5, 2.5))
+                                await house_element.check()
+                                await wait_for_network_idle(page)
                                 return True
                         else:
                             # It's a button or other element
-                            is_selected = (house_element.get_attribute('aria-pressed') == 'true' or
-                                         'selected' in (house_element.get_attribute('class') or '').lower() or
-                                         'active' in (house_element.get_attribute('class') or '').lower())
+                            is_selected = (state['pressed'] == 'true' or
+                                         'selected' in state['className'] or
+                                         'active' in state['className'])
                             
                             if not is_selected:
                                 logger.info(f"Clicking house filter button: {selector}")
-                                house_element.click()
-                                time.sleep(random.uniform(1.5, 2.5))
+                                await house_element.click()
                                 
                                 # Wait for results to update
-                                page.wait_for_timeout(2000)
+                                await wait_for_network_idle(page)
                                 return True
                             else:
                                 logger.info("House filter already selected")
@@ -359,6 +546,7 @@ def filter_for_houses(page: Page):
         # Alternative: Try URL parameter approach
         current_url = page.url
         if 'propertyType' not in current_url:
+            card_locator = page.locator(CARD_SELECTOR)
             # Try different URL parameter formats
             separator = '&' if '?' in current_url else '?'
             test_urls = [
@@ -370,13 +558,16 @@ def filter_for_houses(page: Page):
             for test_url in test_urls:
                 try:
                     logger.info(f"Trying filtered URL: {test_url}")
-                    page.goto(test_url, wait_until='domcontentloaded', timeout=30000)
-                    time.sleep(random.uniform(2.0, 3.0))
+                    await page.goto(test_url, wait_until='domcontentloaded', timeout=30000)
+                    try:
+                        await card_locator.first.wait_for(state='attached', timeout=5000)
+                    except PlaywrightTimeoutError:
+                        pass
                     
                     # Check if we got results
-                    cards = page.query_selector_all('[data-test="property-card"], [data-testid="property-card"]')
-                    if cards:
-                        logger.info(f"Filtered URL worked, found {len(cards)} cards")
+                    card_count = await card_locator.count()
+                    if card_count:
+                        logger.info(f"Filtered URL worked, found {card_count} cards")
                         return True
                 except Exception:
                     continue
@@ -389,42 +580,88 @@ def filter_for_houses(page: Page):
         return False
 
 
-def click_property_card_and_collect_url(context, card, seen_urls: Set[str], page: Page) -> str:
+def create_http_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client used to resolve detail URLs without opening a tab."""
+    return httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        headers={'User-Agent': USER_AGENT},
+        timeout=15.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    )
+
+
+async def block_resources(target, resource_types=BLOCKED_RESOURCE_TYPES):
+    """Abort requests for the given resource types on a page or a whole context."""
+    async def handle_route(route):
+        if route.request.resource_type in resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    await target.route('**/*', handle_route)
+
+
+async def create_page_pool(context, size: int) -> asyncio.Queue:
+    """Open `size` tabs up front so property pages can reuse them instead of opening a tab per card."""
+    page_pool = asyncio.Queue()
+    for _ in range(size):
+        pooled_page = await context.new_page()
+        await block_resources(pooled_page, DETAIL_BLOCKED_RESOURCE_TYPES)
+        await page_pool.put(pooled_page)
+    return page_pool
+
+
+async def release_pooled_page(page_pool: asyncio.Queue, pooled_page: Page):
+    """Blank a pooled tab so it stops running the detail page's scripts, then return it to the pool."""
+    try:
+        await pooled_page.goto('about:blank')
+    except Exception:
+        pass
+    page_pool.put_nowait(pooled_page)
+
+
+async def resolve_detail_url_via_http(client: httpx.AsyncClient, full_url: str, seen_urls: Set[str]) -> str:
+    """
+    Resolve a /homedetails/ URL with a HEAD request instead of a browser tab.
+    The href already identifies the property, so the URL is collected even if the
+    request is blocked; a redirect to another Zillow zpid URL is followed.
+    Returns the URL if it hasn't been seen, None otherwise.
     """
-    Click a property card to open it in a NEW TAB, then collect the URL from the address bar.
+    normalized = normalize_url(full_url)
+    try:
+        resp = await client.head(full_url)
+        if resp.status_code in BLOCKED_STATUS_CODES:
+            logger.warning(f"    ⚠️  HEAD blocked ({resp.status_code}) for {normalized}, collecting href as-is")
+        else:
+            final_url = normalize_url(str(resp.url))
+            if final_url != normalized and final_url.startswith(BASE_URL) and 'zpid' in final_url:
+                logger.info(f"    → Redirected to: {final_url}")
+                normalized = final_url
+    except httpx.HTTPError as e:
+        logger.debug(f"HEAD request failed for {full_url}: {e}")
+    
+    if normalized in seen_urls:
+        logger.info(f"  ⏭️  Already seen, skipping: {normalized}")
+        return None
+    logger.info(f"  ✅ SUCCESS - Collected: {normalized}")
+    return normalized
+
+
+async def click_property_card_and_collect_url(context, href: Optional[str], seen_urls: Set[str], page: Page, client: Optional[httpx.AsyncClient] = None, page_pool: Optional[asyncio.Queue] = None) -> str:
+    """
+    Open a property card's link (as read by CARD_DATA_JS) in a NEW TAB, then collect the URL from the address bar.
     This mimics human behavior of Ctrl+Click or middle-click to open in new tab.
+    Direct /homedetails/ links are resolved with a lightweight HTTP request instead when a client is given.
+    When a page_pool is given, a pooled tab is borrowed instead of opening and closing one.
     Returns the URL if successful, None otherwise.
     """
     try:
-        # Find the clickable link within the card - try multiple selectors
-        link = None
-        link_selectors = [
-            'a[href*="homedetails"]',  # Try homedetails first (more common)
-            'a[href*="/b/"]',
-            'a[data-test*="property-card-link"]',
-            'a',
-        ]
-        
-        for selector in link_selectors:
-            link = card.query_selector(selector)
-            if link:
-                href = link.get_attribute('href')
-                if href and ('/b/' in href or 'homedetails' in href) and '/browse/' not in href and 'zpid' in href:
-                    break
-                else:
-                    link = None
-        
-        if not link:
+        if not href:
             logger.warning("    ❌ No valid link found in card")
             return None
         
-        # Get the href to check if it's a valid detail page
-        href = link.get_attribute('href')
         logger.info(f"    Found href: {href}")
-        
-        if not href:
-            logger.warning("    ❌ No href attribute")
-            return None
             
         if '/browse/' in href:
             logger.warning("    ❌ Skipping browse URL")
@@ -438,8 +675,16 @@ def click_property_card_and_collect_url(context, card, seen_urls: Set[str], page
         else:
             return None
         
-        # Create a new page (new tab) BEFORE clicking
-        new_page = context.new_page()
+        # Direct detail links don't need a browser tab - resolve them over plain HTTP
+        if client is not None and '/homedetails/' in href and 'zpid' in href:
+            return await resolve_detail_url_via_http(client, full_url, seen_urls)
+        
+        # Borrow a pooled tab, or create a new page (new tab) BEFORE clicking
+        if page_pool is not None:
+            new_page = await page_pool.get()
+        else:
+            new_page = await context.new_page()
+            await block_resources(new_page, DETAIL_BLOCKED_RESOURCE_TYPES)
         
         try:
             # Use Ctrl+Click (or Cmd+Click on Mac) to open in new tab - more human-like
@@ -448,10 +693,21 @@ def click_property_card_and_collect_url(context, card, seen_urls: Set[str], page
             
             # Method 1: Navigate the new page directly (simulates opening in new tab)
             # This is more reliable than trying to intercept the click
-            new_page.goto(full_url, wait_until='domcontentloaded', timeout=30000)
+            response = await new_page.goto(full_url, wait_until='domcontentloaded', timeout=30000)
             
-            # Wait for page to fully load
-            time.sleep(random.uniform(2.0, 3.5))
+            # The response status is the bot-wall signal - no need to read the title
+            if response is None or response.status in BLOCKED_STATUS_CODES:
+                logger.warning(f"    ⚠️  BLOCKED ({response.status if response else 'no response'}) for {full_url}")
+            else:
+                # Wait for the detail page to render instead of sleeping a fixed time
+                try:
+                    await new_page.wait_for_selector(
+                        'script[type="application/ld+json"], [data-testid="home-details"]',
+                        state='attached',
+                        timeout=8000
+                    )
+                except PlaywrightTimeoutError:
+                    pass
             
             # Get the URL from the address bar of the new tab
             url = new_page.url
@@ -460,24 +716,10 @@ def click_property_card_and_collect_url(context, card, seen_urls: Set[str], page
             # Normalize it
             normalized = normalize_url(url)
             
-            # Log page title for debugging (but don't block based on it)
-            try:
-                page_title = new_page.title()
-                logger.info(f"    → Page title: {page_title}")
-            except Exception:
-                pass
-            
             # Collect URL regardless of page state (challenge, blocked, etc.)
             # Check if it's a valid detail page URL
             # Zillow uses both /homedetails/ and /b/ formats for property pages
-            is_valid_detail_page = (
-                normalized.startswith(BASE_URL) and
-                ('/homedetails/' in normalized or '/b/' in normalized) and
-                '/browse/' not in normalized and
-                'zpid' in normalized  # Zillow property IDs
-            )
-            
-            if is_valid_detail_page:
+            if _VALID_DETAIL_RE.match(normalized) and '/browse/' not in normalized:
                 if normalized not in seen_urls:
                     logger.info(f"  ✅ SUCCESS - Collected: {normalized}")
                     return normalized
@@ -499,34 +741,70 @@ def click_property_card_and_collect_url(context, card, seen_urls: Set[str], page
                     return None
                 
         finally:
-            # Close the new tab (like a human would)
-            new_page.close()
+            # Return the tab to the pool, or close it (like a human would)
+            if page_pool is not None:
+                await release_pooled_page(page_pool, new_page)
+            else:
+                await new_page.close()
             # Small delay between tabs
-            time.sleep(random.uniform(0.8, 1.5))
+            await human_jitter()
             
     except Exception as e:
         logger.warning(f"Error clicking card: {e}")
         return None
 
 
-def save_url_to_csv(url: str, output_csv: str):
-    """Append a single URL to the CSV file immediately."""
-    try:
-        import os
-        file_exists = os.path.exists(output_csv)
-        
-        with open(output_csv, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            # Write header if file is new
-            if not file_exists:
-                writer.writerow(['url'])
-            # Write the URL
-            writer.writerow([url])
-    except Exception as e:
-        logger.warning(f"Error saving URL to CSV: {e}")
+class CsvSink:
+    """
+    Append-only URL CSV that stays open for the whole run.
+    Rows are buffered and flushed every FLUSH_EVERY writes instead of reopening the file per URL.
+    """
+    FLUSH_EVERY = 16
+    
+    def __init__(self, output_csv: str):
+        self.output_csv = output_csv
+        self._fh = open(output_csv, 'a', newline='', encoding='utf-8', buffering=65536)
+        self._writer = csv.writer(self._fh)
+        self._pending = 0
+        # Write header if file is new
+        if self._fh.tell() == 0:
+            self._writer.writerow(['url'])
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def write(self, url: str):
+        """Append a single URL, flushing to disk periodically."""
+        try:
+            self._writer.writerow([url])
+            self._pending += 1
+            if self._pending >= self.FLUSH_EVERY:
+                self._fh.flush()
+                self._pending = 0
+        except Exception as e:
+            logger.warning(f"Error saving URL to CSV: {e}")
+    
+    def write_many(self, urls: List[str]):
+        """Append a batch of URLs (e.g. one search page's worth) and flush once."""
+        if not urls:
+            return
+        try:
+            self._writer.writerows([url] for url in urls)
+            self._fh.flush()
+            self._pending = 0
+        except Exception as e:
+            logger.warning(f"Error saving URLs to CSV: {e}")
+    
+    def close(self):
+        """Flush buffered rows and close the file."""
+        if not self._fh.closed:
+            self._fh.close()
 
 
-def collect_urls_from_all_pages(context, seen_urls: Set[str], output_csv: str) -> List[str]:
+def collect_urls_from_all_pages(context, seen_urls: Set[str], sink: CsvSink) -> List[str]:
     """
     Check all pages in the context and collect any property URLs from them.
     This includes pages that might have opened due to challenges or redirects.
@@ -547,21 +825,13 @@ def collect_urls_from_all_pages(context, seen_urls: Set[str], output_csv: str) -
                 # Normalize it
                 normalized = normalize_url(url)
                 
-                # Check if it's a valid property URL
-                is_valid_detail_page = (
-                    normalized.startswith(BASE_URL) and
-                    ('/homedetails/' in normalized or '/b/' in normalized) and
-                    '/browse/' not in normalized and
-                    'zpid' in normalized
-                )
-                
                 # Also collect if it's any zillow URL with zpid (even if format is non-standard)
                 if normalized.startswith(BASE_URL) and 'zpid' in normalized:
                     if normalized not in seen_urls:
                         logger.info(f"  🔍 Found URL from open page: {normalized}")
                         collected_urls.append(normalized)
-                        seen_urls.add(normalized)
-                        save_url_to_csv(normalized, output_csv)
+                        mark_seen(seen_urls, normalized)
+                        sink.write(normalized)
                         logger.info(f"  ✅ Collected and saved: {normalized}")
             except Exception as e:
                 logger.debug(f"Error checking page for URLs: {e}")
@@ -573,10 +843,11 @@ def collect_urls_from_all_pages(context, seen_urls: Set[str], output_csv: str) -
     return collected_urls
 
 
-def collect_urls_from_page(context, page: Page, seen_urls: Set[str], output_csv: str) -> List[str]:
+async def collect_urls_from_page(context, page: Page, seen_urls: Set[str], sink: CsvSink, max_concurrency: int = MAX_CONCURRENCY, client: Optional[httpx.AsyncClient] = None, page_pool: Optional[asyncio.Queue] = None, card_locator=None) -> List[str]:
     """
-    Collect URLs by slowly scrolling and clicking each property card one at a time.
-    Saves each URL to CSV immediately after collection.
+    Collect URLs by slowly scrolling, then building detail URLs from each card's zpid.
+    Cards without a zpid in their link are opened in up to max_concurrency tabs at once.
+    Writes the page's new URLs to the CSV sink in one batch before returning.
     Returns list of new URLs collected.
     """
     collected_urls = []
@@ -584,125 +855,205 @@ def collect_urls_from_page(context, page: Page, seen_urls: Set[str], output_csv:
     
     try:
         # Start at the top
-        page.evaluate("window.scrollTo(0, 0)")
-        time.sleep(random.uniform(1.0, 1.5))
+        await page.evaluate("window.scrollTo(0, 0)")
+        await human_jitter()
         
         logger.info("Step 1: Scrolling through entire page to load all property cards...")
         
-        # First, scroll through the entire page to ensure all cards are loaded
-        viewport_height = page.viewport_size['height']
-        page_height = page.evaluate("document.body.scrollHeight")
-        current_scroll = 0
-        scroll_step = 300  # Scroll in small increments
-        max_scroll = page_height - viewport_height + 100
+        # Scroll through the entire page in one page-side call so all cards are loaded
+        scroll_result = await page.evaluate(SCROLL_TO_BOTTOM_JS, {'step': None, 'delay': 200, 'maxSteps': 200, 'maxBackoff': 2000, 'cardSelector': CARD_SELECTOR, 'maxCards': SEARCH_PAGE_SIZE})
+        logger.info(f"Finished scrolling. Final page height: {scroll_result['height']}, {scroll_result['cards']} cards rendered")
         
-        # Scroll through entire page first
-        while current_scroll < max_scroll:
-            # Scroll down slowly
-            current_scroll += scroll_step
-            if current_scroll > max_scroll:
-                current_scroll = max_scroll
-            
-            page.evaluate(f"window.scrollTo(0, {current_scroll})")
-            time.sleep(random.uniform(0.8, 1.2))  # Faster scroll for initial load
-            
-            # Check if page height increased (new content loaded)
-            new_page_height = page.evaluate("document.body.scrollHeight")
-            if new_page_height > page_height:
-                logger.info(f"  Page height increased: {page_height} -> {new_page_height}, continuing scroll...")
-                page_height = new_page_height
-                max_scroll = page_height - viewport_height + 100
-        
-        # Final scroll to bottom to ensure everything is loaded
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(random.uniform(2.0, 3.0))
-        
-        # Get final page height after all scrolling
-        final_page_height = page.evaluate("document.body.scrollHeight")
-        logger.info(f"Finished scrolling. Final page height: {final_page_height}")
+        # Cards whose link already carries a zpid don't need a tab - build the URL from the DOM
+        logger.info("Step 2: Reading property links straight from the card DOM...")
+        cards = card_locator if card_locator is not None else page.locator(CARD_SELECTOR)
+        # A card often links its photo and address to the same page - dedupe in the page
+        hrefs = await cards.locator('a[href*="homedetails"]').evaluate_all('els => [...new Set(els.map(e => e.href))]')
+        for href in hrefs:
+            match = ZPID_RE.search(href or '')
+            if not match:
+                continue
+            zpid = match.group(1)
+            url = canonical_detail_url(zpid)
+            # mark_seen stores the canonical form of every URL, so this also catches slugged URLs
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+            collected_urls.append(url)
+        logger.info(f"  ✅ Collected {len(collected_urls)} new URLs from {len(hrefs)} card links")
         
-        # Now collect all unique card hrefs from the entire page
-        logger.info("Step 2: Collecting all property cards from the page...")
-        all_cards = page.query_selector_all('[data-test="property-card"], [data-testid="property-card"]')
+        # Remaining cards (no zpid in the href) fall back to opening a tab
+        logger.info("Step 3: Collecting cards without a direct detail link...")
+        # The scroll call already counted the cards - skip the read when there are none
+        all_cards = await cards.evaluate_all(CARD_DATA_JS) if scroll_result['cards'] else []
         logger.info(f"Found {len(all_cards)} total property cards on this page")
         
         # Build a list of cards with their hrefs and positions
         cards_to_process = []
         for card in all_cards:
-            try:
-                link = card.query_selector('a[href*="homedetails"], a[href*="/b/"]')
-                if not link:
-                    continue
-                
-                href = link.get_attribute('href')
-                if not href:
-                    continue
-                
-                # Skip if we've already processed this card
-                if href in processed_card_hrefs:
-                    continue
-                
-                # Get card position
-                box = card.bounding_box()
-                if not box:
-                    continue
-                
-                cards_to_process.append((card, href, box))
-            except Exception as e:
-                logger.debug(f"Error extracting card info: {e}")
+            href = card['href']
+            if not href:
+                continue
+            
+            # Skip cards handled from the DOM and ones we've already processed
+            if ZPID_RE.search(href) or href in processed_card_hrefs:
                 continue
+            
+            # Skip cards that aren't laid out
+            if not card['width'] or not card['height']:
+                continue
+            
+            # Mark as processed now so duplicate cards on the page don't each get a tab
+            processed_card_hrefs.add(href)
+            cards_to_process.append((card['link'], href, card))
         
-        logger.info(f"Step 3: Processing {len(cards_to_process)} unique cards...")
+        logger.info(f"Step 4: Processing {len(cards_to_process)} fallback cards (up to {max_concurrency} tabs at once)...")
         
-        # Now process each card one by one
-        card_count = 0
-        for card, href, box in cards_to_process:
-            try:
-                # Mark as processed immediately to avoid duplicates
-                processed_card_hrefs.add(href)
-                card_count += 1
-                
-                # Scroll card into view
-                card_top = box['y']
-                page.evaluate(f"window.scrollTo(0, {card_top - 150})")
-                time.sleep(random.uniform(0.5, 1.0))
-                
+        # Process cards concurrently, bounded by a semaphore so only a few tabs are open at a time
+        semaphore = asyncio.Semaphore(max_concurrency)
+        total_cards = len(cards_to_process)
+        
+        async def bounded(card_index: int, link_href: Optional[str], box) -> str:
+            async with semaphore:
                 # Small random mouse movement (human behavior)
                 try:
                     x = box['x'] + box['width'] / 2 + random.randint(-10, 10)
                     y = box['y'] + box['height'] / 2 + random.randint(-10, 10)
-                    page.mouse.move(x, y)
-                    time.sleep(random.uniform(0.3, 0.6))
+                    await page.mouse.move(x, y)
                 except Exception:
                     pass
                 
-                logger.info(f"Clicking card {card_count}/{len(cards_to_process)}...")
+                logger.info(f"Clicking card {card_index}/{total_cards}...")
                 
                 # Click and collect URL
-                url = click_property_card_and_collect_url(context, card, seen_urls, page)
+                url = await click_property_card_and_collect_url(context, link_href, seen_urls, page, client, page_pool)
                 
-                if url:
-                    collected_urls.append(url)
-                    seen_urls.add(url)
+                # No await between the membership check and the add, so concurrent tasks cannot both save a URL
+                if url and url not in seen_urls:
+                    mark_seen(seen_urls, url)
                     
-                    # Save to CSV immediately
-                    save_url_to_csv(url, output_csv)
-                    logger.info(f"  ✅ Collected and saved: {url}")
-                else:
-                    logger.warning(f"  ❌ Failed to collect URL from card {card_count}")
-                
-                # Random pause between clicks (human reading time)
-                time.sleep(random.uniform(1.5, 2.5))
+                    # Written to CSV with the rest of the page
+                    collected_urls.append(url)
+                    logger.info(f"  ✅ Collected: {url}")
+                    return url
                 
-            except Exception as e:
-                logger.debug(f"Error processing card: {e}")
-                continue
+                logger.warning(f"  ❌ Failed to collect URL from card {card_index}")
+                return None
+        
+        tasks = []
+        for link_href, href, box in cards_to_process:
+            tasks.append(bounded(len(tasks) + 1, link_href, box))
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        card_count = len(hrefs) + len(results)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug(f"Error processing card: {result}")
         
         logger.info(f"✅ Finished processing page. Collected {len(collected_urls)} new URLs from {card_count} cards.")
         
     except Exception as e:
         logger.error(f"Error collecting URLs from page: {e}")
     
+    # One batched write per page; runs even if collection stopped partway
+    sink.write_many(collected_urls)
+    return collected_urls
+
+
+async def sample_card_urls(page: Page, n: int = 5) -> Set[str]:
+    """Hrefs of the first n property cards, read in one evaluate call."""
+    return set(await page.evaluate(
+        "([selector, n]) => Array.from(document.querySelectorAll(selector)).slice(0, n).map(a => a.getAttribute('href'))",
+        [CARD_LINK_SELECTOR, n]
+    ))
+
+
+async def collect_urls_from_search_page(context, page_url: str, seen_urls: Set[str], sink: CsvSink, headless: bool, max_concurrency: int = MAX_CONCURRENCY, client: Optional[httpx.AsyncClient] = None, page_pool: Optional[asyncio.Queue] = None, seen_samples: Optional[Set[frozenset]] = None) -> Optional[List[str]]:
+    """
+    Open one search results page in its own tab and collect URLs from it.
+    Returns None if no property cards loaded (end of results or blocked), or if the
+    first cards match a page already visited (Zillow serves the last page again past the end).
+    Navigation and collection errors are logged and re-raised, so the caller can retry the page.
+    """
+    search_page = await context.new_page()
+    card_locator = search_page.locator(CARD_SELECTOR)
+    try:
+        await search_page.goto(page_url, wait_until='domcontentloaded', timeout=60000)
+        try:
+            await card_locator.first.wait_for(timeout=15000)
+        except PlaywrightTimeoutError:
+            # Give a challenge a chance to be solved before giving up on the page
+            if not await detect_and_handle_challenge(search_page, headless):
+                logger.warning(f"Property cards not found on {page_url}")
+                return None
+        if seen_samples is not None:
+            sample = frozenset(await sample_card_urls(search_page))
+            if sample and sample in seen_samples:
+                logger.info(f"Cards on {page_url} repeat an earlier page")
+                return None
+            seen_samples.add(sample)
+        return await collect_urls_from_page(context, search_page, seen_urls, sink, max_concurrency, client, page_pool, card_locator)
+    except Exception as e:
+        logger.warning(f"Error collecting URLs from {page_url}: {e}")
+        raise
+    finally:
+        await search_page.close()
+
+
+async def collect_urls_from_remaining_pages(context, base_url: str, first_page: int, max_pages: Optional[int], seen_urls: Set[str], sink: CsvSink, delay: float, headless: bool, parallel_pages: int = MAX_PARALLEL_PAGES, max_concurrency: int = MAX_CONCURRENCY, client: Optional[httpx.AsyncClient] = None, page_pool: Optional[asyncio.Queue] = None) -> List[str]:
+    """
+    Collect search pages first_page, first_page + 1, ... in batches of parallel_pages tabs.
+    Result pages don't depend on each other, so a batch is fetched concurrently.
+    A page that fails is retried once in the next batch, then skipped.
+    Stops when every page in a batch is past the end of results, or max_pages is reached.
+    No lock is needed around seen_urls: the membership check and add never straddle an await.
+    """
+    collected_urls = []
+    semaphore = asyncio.Semaphore(parallel_pages)
+    page_num = first_page
+    seen_samples = set()
+    # Pages that failed in the last batch, fetched again at the start of the next one
+    retry_nums: List[int] = []
+    
+    async def bounded(page_url: str) -> Optional[List[str]]:
+        async with semaphore:
+            return await collect_urls_from_search_page(context, page_url, seen_urls, sink, headless, max_concurrency, client, page_pool, seen_samples)
+    
+    while True:
+        last_page = page_num + parallel_pages - len(retry_nums) - 1
+        if max_pages is not None:
+            last_page = min(last_page, max_pages)
+        page_nums = retry_nums + list(range(page_num, last_page + 1))
+        if not page_nums:
+            break
+        logger.info(f"\n{'='*80}")
+        logger.info(f"PAGES {', '.join(map(str, page_nums))} ({len(page_nums)} at once)")
+        logger.info(f"{'='*80}")
+        
+        results = await asyncio.gather(*(bounded(get_next_page_url(base_url, n)) for n in page_nums), return_exceptions=True)
+        failed_nums = []
+        for n, urls in zip(page_nums, results):
+            if isinstance(urls, BaseException):
+                if not isinstance(urls, Exception):
+                    raise urls
+                if n in retry_nums:
+                    logger.warning(f"⚠️  Page {n} failed twice, skipping it")
+                else:
+                    failed_nums.append(n)
+            elif urls:
+                collected_urls.extend(urls)
+                logger.info(f"✅ Collected {len(urls)} new URLs from page {n}")
+        logger.info(f"📊 Total unique URLs so far: {len(collected_urls)}")
+        
+        # None means no cards or a repeated page; a page that loaded but had only known URLs keeps the crawl going
+        if all(urls is None for urls in results):
+            logger.info("❌ Every page in this batch is past the end of results, stopping...")
+            break
+        
+        retry_nums = failed_nums
+        page_num = last_page + 1
+        await asyncio.sleep(random.uniform(delay, delay + 2.0))
+    
     return collected_urls
 
 
@@ -722,25 +1073,37 @@ def get_next_page_url(base_url: str, page_num: int) -> str:
 
 
 def load_existing_urls(csv_file: str) -> Set[str]:
-    """Load existing URLs from CSV file to avoid duplicates."""
+    """
+    Load existing URLs from CSV file to avoid duplicates.
+    Large histories are streamed straight into a Bloom filter to bound memory; a false
+    positive (~0.1%) skips a URL rather than writing a duplicate.
+    """
     seen_urls = set()
     try:
-        import os
-        if os.path.exists(csv_file):
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                next(reader, None)  # Skip header
-                for row in reader:
-                    if row and row[0].strip():
-                        normalized = normalize_url(row[0].strip())
-                        seen_urls.add(normalized)
-            logger.info(f"Loaded {len(seen_urls)} existing URLs from {csv_file}")
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+            # Decide up front from the file size so a large history never materializes as a set
+            if (ScalableBloomFilter is not None and
+                    os.fstat(f.fileno()).st_size > SEEN_URLS_BLOOM_THRESHOLD * URL_ROW_BYTES):
+                seen_urls = ScalableBloomFilter(initial_capacity=SEEN_URLS_BLOOM_THRESHOLD, error_rate=0.001)
+                logger.info("Using a Bloom filter for seen URLs")
+            reader = csv.reader(f)
+            next(reader, None)  # Skip header
+            urls = (normalize_url(url) for url in (row[0].strip() for row in reader if row) if url)
+            if isinstance(seen_urls, set):
+                # Built by the set constructor in one pass instead of per-row add() calls
+                seen_urls = {key for url in urls for key in seen_keys(url)}
+            else:
+                for url in urls:
+                    mark_seen(seen_urls, url)
+        logger.info(f"Loaded {len(seen_urls)} known URLs from {csv_file}")
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.warning(f"Error loading existing URLs: {e}")
     return seen_urls
 
 
-def human_like_browsing_start(page: Page):
+async def human_like_browsing_start(page: Page):
     """
     Start browsing session in a human-like way by visiting Google first,
     then navigating to Zillow. This helps avoid bot detection.
@@ -750,56 +1113,80 @@ def human_like_browsing_start(page: Page):
         logger.info("Step 1: Visiting Google...")
         
         # Visit Google first
-        page.goto("https://www.google.com", wait_until='domcontentloaded', timeout=30000)
-        time.sleep(random.uniform(2.0, 3.5))
+        await page.goto("https://www.google.com", wait_until='domcontentloaded', timeout=30000)
+        await asyncio.sleep(random.uniform(2.0, 3.5))
         
         # Simulate human behavior: move mouse, scroll a bit
         try:
             # Random mouse movements
             for _ in range(random.randint(2, 4)):
-                page.mouse.move(random.randint(100, 800), random.randint(100, 600))
-                time.sleep(random.uniform(0.3, 0.7))
+                await page.mouse.move(random.randint(100, 800), random.randint(100, 600))
+                await asyncio.sleep(random.uniform(0.3, 0.7))
             
-            # Scroll down a bit
-            page.evaluate("window.scrollTo(0, 300)")
-            time.sleep(random.uniform(0.8, 1.5))
-            
-            # Scroll back up
-            page.evaluate("window.scrollTo(0, 100)")
-            time.sleep(random.uniform(0.5, 1.0))
+            # Scroll down a bit, then back up
+            await page.evaluate(SCROLL_DOWN_AND_BACK_JS, {'down': 300, 'up': 100, 'pause': random.randint(800, 1500)})
+            await asyncio.sleep(random.uniform(0.5, 1.0))
         except Exception:
             pass
         
         logger.info("Step 2: Waiting a moment (human reading time)...")
-        time.sleep(random.uniform(3.0, 5.0))
+        await asyncio.sleep(random.uniform(3.0, 5.0))
         
         # Sometimes visit another page to make it more realistic
         if random.random() < 0.3:  # 30% chance
             try:
                 logger.info("Step 2.5: Visiting another page (more realistic browsing)...")
-                page.goto("https://www.google.com/search?q=real+estate", wait_until='domcontentloaded', timeout=30000)
-                time.sleep(random.uniform(2.0, 3.5))
+                await page.goto("https://www.google.com/search?q=real+estate", wait_until='domcontentloaded', timeout=30000)
+                await asyncio.sleep(random.uniform(2.0, 3.5))
                 
                 # More mouse movements
                 for _ in range(random.randint(1, 3)):
-                    page.mouse.move(random.randint(200, 700), random.randint(200, 500))
-                    time.sleep(random.uniform(0.3, 0.6))
+                    await page.mouse.move(random.randint(200, 700), random.randint(200, 500))
+                    await asyncio.sleep(random.uniform(0.3, 0.6))
             except Exception:
                 pass
         
         logger.info("Step 3: Now navigating to Zillow...")
-        time.sleep(random.uniform(1.0, 2.0))
+        await asyncio.sleep(random.uniform(1.0, 2.0))
         return True
     except Exception as e:
         logger.warning(f"Error in human-like browsing start: {e}")
         return False
 
 
-def collect_urls(city: str, state: str, delay: float, output_csv: str, headless: bool = False, max_pages: int = None, start_page: int = 1):
+def collect_urls(city: str, state: str, delay: float, output_csv: str, headless: bool = False, max_pages: int = None, start_page: int = 1, max_concurrency: int = MAX_CONCURRENCY, parallel_pages: int = MAX_PARALLEL_PAGES, storage_state: str = STORAGE_STATE_PATH):
+    """Synchronous entry point; runs collect_urls_async on a fresh event loop."""
+    asyncio.run(collect_urls_async(
+        city=city,
+        state=state,
+        delay=delay,
+        output_csv=output_csv,
+        headless=headless,
+        max_pages=max_pages,
+        start_page=start_page,
+        max_concurrency=max_concurrency,
+        parallel_pages=parallel_pages,
+        storage_state=storage_state
+    ))
+
+
+async def save_storage_state(context, storage_state: str):
+    """Persist cookies and localStorage so the next run can skip the warm-up and challenge checks."""
+    try:
+        os.makedirs(os.path.dirname(storage_state) or '.', exist_ok=True)
+        await context.storage_state(path=storage_state)
+        logger.info(f"💾 Saved browser session to {storage_state}")
+    except Exception as e:
+        logger.warning(f"Error saving browser session: {e}")
+
+
+async def collect_urls_async(city: str, state: str, delay: float, output_csv: str, headless: bool = False, max_pages: int = None, start_page: int = 1, max_concurrency: int = MAX_CONCURRENCY, parallel_pages: int = MAX_PARALLEL_PAGES, storage_state: str = STORAGE_STATE_PATH):
     """Collect property URLs from Zillow search pages by clicking through cards.
     Runs indefinitely until no more pages are available (no property cards found on consecutive pages).
+    After the first page, up to parallel_pages search pages are fetched at once (1 keeps it sequential).
+    A session saved at storage_state is reused, skipping the Google warm-up; it is saved again after the first page.
     """
-    city_normalized = city.lower().replace(' ', '-').replace(',', '').replace("'", "")
+    city_normalized = city.lower().translate(_CITY_TABLE)
     state_normalized = state.lower()
     
     all_urls = []
@@ -815,11 +1202,13 @@ def collect_urls(city: str, state: str, delay: float, output_csv: str, headless:
     logger.info(f"Max pages: {'Unlimited (runs until no more pages)' if max_pages is None else max_pages}")
     logger.info(f"Output: {output_csv}")
     logger.info(f"Headless: {headless}")
+    logger.info(f"Max concurrency: {max_concurrency}")
+    logger.info(f"Parallel pages: {parallel_pages}")
     logger.info("=" * 80)
     
-    with sync_playwright() as p:
+    async with async_playwright() as p:
         # Use installed Chrome instead of Chromium for better anti-bot evasion
-        browser = p.chromium.launch(
+        browser = await p.chromium.launch(
             headless=headless,
             channel="chrome",  # Use installed Chrome browser instead of bundled Chromium
             args=[
@@ -827,10 +1216,19 @@ def collect_urls(city: str, state: str, delay: float, output_csv: str, headless:
                 '--disable-dev-shm-usage',
                 '--no-sandbox',
                 '--disable-setuid-sandbox',
+                '--disable-gpu',
+                '--disable-background-networking',
+                '--disable-features=Translate,BackForwardCache',
+                '--blink-settings=imagesEnabled=false',  # Skip image decoding entirely
             ]
         )
         
-        context = browser.new_context(
+        has_saved_session = bool(storage_state) and os.path.exists(storage_state)
+        if has_saved_session:
+            logger.info(f"Reusing saved browser session from {storage_state}")
+        
+        context = await browser.new_context(
+            storage_state=storage_state if has_saved_session else None,
             user_agent=USER_AGENT,
             viewport={'width': 1920, 'height': 1080},
             locale='en-US',
@@ -855,80 +1253,23 @@ def collect_urls(city: str, state: str, delay: float, output_csv: str, headless:
         )
         
         # Add comprehensive stealth scripts to avoid detection
-        context.add_init_script("""
-            // Remove webdriver property
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            // Override plugins to look like real Chrome
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => {
-                    const plugins = [];
-                    for (let i = 0; i < 5; i++) {
-                        plugins.push({
-                            0: {type: 'application/x-google-chrome-pdf', suffixes: 'pdf', description: 'Portable Document Format'},
-                            description: 'Portable Document Format',
-                            filename: 'internal-pdf-viewer',
-                            length: 1,
-                            name: 'Chrome PDF Plugin'
-                        });
-                    }
-                    return plugins;
-                }
-            });
-            
-            // Override languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-            
-            // Chrome runtime (make it look like real Chrome)
-            window.chrome = {
-                runtime: {},
-                loadTimes: function() {},
-                csi: function() {},
-                app: {}
-            };
-            
-            // Override permissions API
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-            
-            // Override getBattery to return realistic values
-            if (navigator.getBattery) {
-                navigator.getBattery = () => Promise.resolve({
-                    charging: true,
-                    chargingTime: 0,
-                    dischargingTime: Infinity,
-                    level: 1
-                });
-            }
-            
-            // Override platform
-            Object.defineProperty(navigator, 'platform', {
-                get: () => 'Win32'
-            });
-            
-            // Add missing properties that real Chrome has
-            Object.defineProperty(navigator, 'hardwareConcurrency', {
-                get: () => 8
-            });
-            
-            Object.defineProperty(navigator, 'deviceMemory', {
-                get: () => 8
-            });
-        """)
+        await context.add_init_script(path=STEALTH_JS_PATH)
         
-        page = context.new_page()
+        # Images, media and fonts are never needed to collect URLs
+        await block_resources(context)
+        
+        page = await context.new_page()
+        # Built once and reused for every card check on the main tab
+        card_locator = page.locator(CARD_SELECTOR)
+        client = create_http_client()
+        page_pool = await create_page_pool(context, max_concurrency)
+        sink = CsvSink(output_csv)
         
         try:
             # Start with human-like browsing pattern (visit Google first)
-            human_like_browsing_start(page)
+            # A saved session already looks like a returning visitor
+            if not has_saved_session:
+                await human_like_browsing_start(page)
             
             # Store base URL for pagination (page 1 doesn't have /1_p, it's just the base URL)
             base_url = search_url.rstrip('/')
@@ -955,15 +1296,15 @@ def collect_urls(city: str, state: str, delay: float, output_csv: str, headless:
                 try:
                     # Add human-like mouse movement before navigation
                     try:
-                        page.mouse.move(random.randint(50, 200), random.randint(50, 200))
-                        time.sleep(random.uniform(0.3, 0.7))
+                        await page.mouse.move(random.randint(50, 200), random.randint(50, 200))
+                        await asyncio.sleep(random.uniform(0.3, 0.7))
                     except Exception:
                         pass
                     
                     # Set referrer to Google for page 1 only (looks like user came from search)
                     referrer = "https://www.google.com/" if page_num == 1 else None
                     
-                    page.goto(
+                    await page.goto(
                         page_url, 
                         wait_until='domcontentloaded', 
                         timeout=60000,
@@ -971,15 +1312,15 @@ def collect_urls(city: str, state: str, delay: float, output_csv: str, headless:
                     )
                     
                     # Human-like behavior after page load
-                    time.sleep(random.uniform(2.0, 3.5))
+                    await asyncio.sleep(random.uniform(2.0, 3.5))
                     
                     # Random mouse movements to simulate human interaction
                     try:
                         for _ in range(random.randint(1, 3)):
                             x = random.randint(100, 1800)
                             y = random.randint(100, 900)
-                            page.mouse.move(x, y)
-                            time.sleep(random.uniform(0.2, 0.5))
+                            await page.mouse.move(x, y)
+                            await asyncio.sleep(random.uniform(0.2, 0.5))
                     except Exception:
                         pass
                 except Exception as e:
@@ -991,13 +1332,13 @@ def collect_urls(city: str, state: str, delay: float, output_csv: str, headless:
                     continue
                 
                 # Check for and handle anti-bot challenge (but continue regardless)
-                challenge_handled = detect_and_handle_challenge(page, headless)
+                challenge_handled = await detect_and_handle_challenge(page, headless)
                 if challenge_handled:
-                    time.sleep(random.uniform(2.0, 3.0))  # Wait after challenge
+                    await asyncio.sleep(random.uniform(2.0, 3.0))  # Wait after challenge
                 
                 # Collect URLs from any pages that might have opened (challenge pages, redirects, etc.)
                 try:
-                    urls_from_pages = collect_urls_from_all_pages(context, seen_urls, output_csv)
+                    urls_from_pages = collect_urls_from_all_pages(context, seen_urls, sink)
                     if urls_from_pages:
                         all_urls.extend(urls_from_pages)
                         logger.info(f"  📋 Collected {len(urls_from_pages)} URLs from open pages")
@@ -1006,59 +1347,54 @@ def collect_urls(city: str, state: str, delay: float, output_csv: str, headless:
                 
                 # Additional human-like behaviors: random scrolling and mouse movements
                 try:
-                    # Random scroll to simulate reading
+                    # Random scroll to simulate reading, then back up a bit (human behavior)
                     scroll_amount = random.randint(200, 600)
-                    page.evaluate(f"window.scrollTo(0, {scroll_amount})")
-                    time.sleep(random.uniform(0.5, 1.0))
-                    
-                    # Scroll back up a bit (human behavior)
-                    page.evaluate(f"window.scrollTo(0, {scroll_amount - 100})")
-                    time.sleep(random.uniform(0.3, 0.7))
+                    await page.evaluate(SCROLL_DOWN_AND_BACK_JS, {'down': scroll_amount, 'up': scroll_amount - 100, 'pause': random.randint(500, 1000)})
+                    await asyncio.sleep(random.uniform(0.3, 0.7))
                     
                     # More mouse movements
                     for _ in range(random.randint(2, 4)):
                         x = random.randint(200, 1700)
                         y = random.randint(200, 800)
-                        page.mouse.move(x, y)
-                        time.sleep(random.uniform(0.2, 0.4))
+                        await page.mouse.move(x, y)
+                        await asyncio.sleep(random.uniform(0.2, 0.4))
                 except Exception:
                     pass
                 
                 # Additional check: if no cards found, wait longer and check again for challenge
                 try:
-                    cards_check = page.query_selector_all('[data-test="property-card"], [data-testid="property-card"]')
-                    if not cards_check or len(cards_check) == 0:
+                    if await card_locator.count() == 0:
                         if not headless:
                             logger.warning("⚠️  No property cards found - this might indicate a challenge is blocking the page.")
                             logger.warning("   Please check the browser window and solve any challenges you see.")
                             logger.warning("   Waiting 20 seconds for you to interact with the page...")
-                            time.sleep(20)
+                            await asyncio.sleep(20)
                             # Check challenge again after wait
-                            detect_and_handle_challenge(page, headless)
-                            time.sleep(random.uniform(2.0, 3.0))
+                            await detect_and_handle_challenge(page, headless)
+                            await asyncio.sleep(random.uniform(2.0, 3.0))
                 except Exception as e:
                     logger.debug(f"Error checking cards: {e}")
                 
                 # Wait for page to load (with challenge check) - longer wait for first page
                 wait_time = random.uniform(3.0, 5.0) if page_num == start_page else random.uniform(1.5, 2.5)
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
                 
                 # Wait for page to load and check if property cards exist
                 # But continue regardless - we'll collect whatever URLs we can find
                 cards_found = False
                 try:
-                    page.wait_for_selector('[data-test="property-card"], [data-testid="property-card"]', timeout=15000)
+                    await card_locator.first.wait_for(timeout=15000)
                     logger.info("✅ Property cards loaded")
                     cards_found = True
                     consecutive_empty_pages = 0  # Reset counter if we found cards
                 except Exception:
                     # Check again for challenge - might have appeared after initial load
                     if not challenge_handled:
-                        detect_and_handle_challenge(page, headless)
-                        time.sleep(random.uniform(2.0, 3.0))
+                        await detect_and_handle_challenge(page, headless)
+                        await asyncio.sleep(random.uniform(2.0, 3.0))
                         # Try waiting for cards again
                         try:
-                            page.wait_for_selector('[data-test="property-card"], [data-testid="property-card"]', timeout=10000)
+                            await card_locator.first.wait_for(timeout=10000)
                             logger.info("✅ Property cards loaded after challenge")
                             cards_found = True
                             consecutive_empty_pages = 0
@@ -1070,30 +1406,28 @@ def collect_urls(city: str, state: str, delay: float, output_csv: str, headless:
                     # Still try to collect in case cards load slowly or page is a property detail page
                 
                 # Check if current page URL is itself a property URL (might have been redirected)
+                current_url = page.url
                 try:
-                    current_url = page.url
                     if current_url:
                         normalized = normalize_url(current_url)
-                        if (normalized.startswith(BASE_URL) and 
-                            ('/homedetails/' in normalized or '/b/' in normalized) and
+                        if (_VALID_DETAIL_RE.match(normalized) and
                             '/browse/' not in normalized and
-                            'zpid' in normalized and
                             normalized not in seen_urls):
                             logger.info(f"  🔍 Current page is a property URL: {normalized}")
                             all_urls.append(normalized)
-                            seen_urls.add(normalized)
-                            save_url_to_csv(normalized, output_csv)
+                            mark_seen(seen_urls, normalized)
+                            sink.write(normalized)
                             logger.info(f"  ✅ Collected current page URL: {normalized}")
                             consecutive_empty_pages = 0
                 except Exception as e:
                     logger.debug(f"Error checking current page URL: {e}")
                 
-                logger.info(f"Current URL: {page.url}")
+                logger.info(f"Current URL: {current_url}")
                 
                 # Collect URLs by clicking through cards (saves to CSV incrementally)
                 # Continue even if there are challenges - collect whatever we can
                 try:
-                    urls = collect_urls_from_page(context, page, seen_urls, output_csv)
+                    urls = await collect_urls_from_page(context, page, seen_urls, sink, max_concurrency, client, page_pool, card_locator)
                     
                     if urls:
                         all_urls.extend(urls)
@@ -1111,7 +1445,7 @@ def collect_urls(city: str, state: str, delay: float, output_csv: str, headless:
                     # Continue anyway - don't stop on errors
                     # Check for URLs from any open pages
                     try:
-                        urls_from_pages = collect_urls_from_all_pages(context, seen_urls, output_csv)
+                        urls_from_pages = collect_urls_from_all_pages(context, seen_urls, sink)
                         if urls_from_pages:
                             all_urls.extend(urls_from_pages)
                             logger.info(f"  📋 Collected {len(urls_from_pages)} URLs from open pages after error")
@@ -1127,13 +1461,26 @@ def collect_urls(city: str, state: str, delay: float, output_csv: str, headless:
                 
                 # Final check for URLs from any pages that might have opened
                 try:
-                    urls_from_pages = collect_urls_from_all_pages(context, seen_urls, output_csv)
+                    urls_from_pages = collect_urls_from_all_pages(context, seen_urls, sink)
                     if urls_from_pages:
                         all_urls.extend(urls_from_pages)
                         logger.info(f"  📋 Final check: Collected {len(urls_from_pages)} URLs from open pages")
                 except Exception as e:
                     logger.debug(f"Error in final URL collection check: {e}")
                 
+                # The first page has cleared any challenge - keep the session for next time
+                if storage_state and page_num == start_page:
+                    await save_storage_state(context, storage_state)
+                
+                # Fetch the rest a batch of pages at a time
+                if parallel_pages > 1:
+                    await asyncio.sleep(random.uniform(delay, delay + 2.0))
+                    all_urls.extend(await collect_urls_from_remaining_pages(
+                        context, base_url, page_num + 1, max_pages, seen_urls, sink, delay, headless,
+                        parallel_pages, max_concurrency, client, page_pool
+                    ))
+                    break
+                
                 # Small delay before next page with more human-like behavior
                 wait_before_next = random.uniform(delay, delay + 2.0)
                 
@@ -1148,12 +1495,12 @@ def collect_urls(city: str, state: str, delay: float, output_csv: str, headless:
                     for _ in range(random.randint(1, 3)):
                         x = random.randint(100, 1800)
                         y = random.randint(100, 900)
-                        page.mouse.move(x, y)
-                        time.sleep(random.uniform(0.5, 1.5))
+                        await page.mouse.move(x, y)
+                        await asyncio.sleep(random.uniform(0.5, 1.5))
                 except Exception:
                     pass
                 
-                time.sleep(wait_before_next)
+                await asyncio.sleep(wait_before_next)
             
             logger.info(f"\n{'='*80}")
             logger.info(f"COLLECTION COMPLETE")
@@ -1167,7 +1514,9 @@ def collect_urls(city: str, state: str, delay: float, output_csv: str, headless:
                     logger.info(f"  {i}. {url}")
             
         finally:
-            browser.close()
+            sink.close()
+            await client.aclose()
+            await browser.close()
 
 
 def main():
@@ -1179,6 +1528,9 @@ def main():
     parser.add_argument('--delay', type=float, default=3.0, help='Delay between pages in seconds (default: 3.0)')
     parser.add_argument('--output', type=str, default='data/zillow_urls.csv', help='Output CSV file (default: data/zillow_urls.csv)')
     parser.add_argument('--headless', action='store_true', help='Run browser in headless mode (NOT recommended - you cannot solve challenges in headless mode)')
+    parser.add_argument('--max_concurrency', type=int, default=MAX_CONCURRENCY, help=f'Property tabs opened concurrently per page (default: {MAX_CONCURRENCY})')
+    parser.add_argument('--storage_state', type=str, default=STORAGE_STATE_PATH, help=f'Browser session file reused between runs; pass "" to disable (default: {STORAGE_STATE_PATH})')
+    parser.add_argument('--parallel_pages', type=int, default=MAX_PARALLEL_PAGES, help=f'Search pages fetched at once after the first page; 1 fetches them one by one (default: {MAX_PARALLEL_PAGES})')
     
     args = parser.parse_args()
     
@@ -1189,7 +1541,10 @@ def main():
         output_csv=args.output,
         headless=args.headless,
         max_pages=args.max_pages,
-        start_page=args.start_page
+        start_page=args.start_page,
+        max_concurrency=args.max_concurrency,
+        parallel_pages=args.parallel_pages,
+        storage_state=args.storage_state
     )
 
 
@@ -4,17 +4,24 @@ Scrape data from Zillow property URLs stored in a CSV file.
 Reads URLs from CSV, navigates to each, and extracts phone, address, manager_name.
 """
 import argparse
+import collections
 import csv
+import functools
+import heapq
+import itertools
+import json
 import logging
+import os
+import queue
 import random
 import re
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Optional, Dict, List
 from urllib.parse import urlparse, urlunparse
 
-import pandas as pd
 from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeoutError
 from bs4 import BeautifulSoup
 
@@ -22,6 +29,13 @@ from bs4 import BeautifulSoup
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.store import Store
 
+# lxml's C parser is much faster than html.parser; fall back if it isn't installed
+try:
+    import lxml  # noqa: F401
+    SOUP_PARSER = 'lxml'
+except ImportError:
+    SOUP_PARSER = 'html.parser'
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -31,8 +45,73 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://www.zillow.com"
 # Use a more recent Chrome user agent
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+# Stealth init script shared by the Zillow scrapers, loaded from a file so both stay in sync
+STEALTH_JS_PATH = str(Path(__file__).parent / 'stealth.js')
+# Cookies/localStorage reused between runs - the same session file collect_urls.py saves
+STORAGE_STATE_PATH = 'data/zillow_state.json'
+# A JSON-LD block without any of these keys has nothing for parse_json_ld, so it is not decoded
+JSON_LD_FIELD_MARKERS = ('"address"', '"telephone"', '"name"')
+# Output CSV columns, one row per phone
+CSV_COLUMNS = ['phone', 'agent_name', 'business_name', 'addresses', 'units']
+# The incremental CSV export reruns after this many new phones, or this many seconds with new phones
+EXPORT_EVERY_PHONES = 25
+EXPORT_INTERVAL = 30.0
+# Requests the extractors never need: static assets and third-party analytics beacons.
+# Stylesheets still load - the extractors check element visibility, which depends on CSS
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+BLOCKED_URL_KEYWORDS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'segment.io',
+    'segment.com',
+    'optimizely.com',
+    'hotjar.com',
+)
+# Compiled once at import; the extractors run these on every property page
+PHONE_RE = re.compile(r'(?:\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}')
+NON_DIGIT_RE = re.compile(r'\D')
+TEL_HREF_RE = re.compile(r'^tel:')
+LEADING_NUMBER_RE = re.compile(r'^\d+')
+STREET_RE = re.compile(r'\d+\s+[A-Za-z0-9\s]+(?:St|Street|Ave|Avenue|Rd|Road|Dr|Drive|Blvd|Boulevard|Ln|Lane|Ct|Court|Way|Pl|Place|Pkwy|Parkway)', re.IGNORECASE)
+STREET_SUFFIX_RE = re.compile(r'(?:St|Street|Ave|Avenue|Rd|Road|Dr|Drive|Blvd|Boulevard|Ln|Lane|Ct|Court|Way|Pl|Place|Pkwy|Parkway)', re.IGNORECASE)
+AGENT_INFO_CLASS_RE = re.compile(r'ds-listing-agent-info')
+BUSINESS_NAME_CLASS_RE = re.compile(r'ds-listing-agent-business-name')
+ADDRESS_TEXT_CLASS_RE = re.compile(r'Text-c11n.*sc-aiai24.*cEHZrB|cEHZrB')
+ADDRESS_FALLBACK_CLASS_RE = re.compile(r'cEHZrB')
+# Page titles of access-denied / bot-check pages
+BLOCKED_TITLE_RE = re.compile(r'denied|blocked', re.IGNORECASE)
+# A blocked URL is retried this many times, after 2**attempt (+ up to 1) seconds, before it is given up
+MAX_BLOCK_ATTEMPTS = 3
+# The listing card texts, JSON-LD block texts and streetAddress meta, read in one evaluate -
+# a few KB instead of serializing the whole page for page.content()
+QUICK_FIELDS_JS = """
+() => {
+    const visible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width && rect.height && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const card = Array.from(document.querySelectorAll('.ds-listing-agent-info, [class*="ds-listing-agent-info"]')).find(visible);
+    const text = (selector) => {
+        const el = card && card.querySelector(selector);
+        return el ? el.innerText : null;
+    };
+    const meta = document.querySelector('meta[itemprop="streetAddress"]');
+    return {
+        card: card ? card.innerText : null,
+        agentName: text('.ds-listing-agent-display-name, [class*="ds-listing-agent-display-name"]'),
+        businessName: text('.ds-listing-agent-business-name, [class*="ds-listing-agent-business-name"]'),
+        jsonLd: Array.from(document.querySelectorAll('script[type="application/ld+json"]'), (s) => s.textContent),
+        streetAddress: meta ? meta.getAttribute('content') : null,
+    };
+}
+"""
+# Street suffixes and directionals kept upper-case by normalize_address
+_STREET_SUFFIXES = frozenset({'ST', 'AVE', 'RD', 'BLVD', 'LN', 'CT', 'DR', 'WAY', 'PL', 'PKWY'})
+_DIR_ABBREV = frozenset({'N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW'})
 
 
+@functools.lru_cache(maxsize=10000)
 def normalize_url(url: str) -> str:
     """Normalize URL by removing query parameters and fragments."""
     parsed = urlparse(url)
@@ -47,12 +126,17 @@ def normalize_url(url: str) -> str:
     return normalized.rstrip('/')
 
 
+def same_listing_path(current_url: str, url: str) -> bool:
+    """Check whether the page is still on the requested listing, comparing URL paths only (trailing slash ignored)."""
+    return urlparse(current_url).path.rstrip('/') == urlparse(url).path.rstrip('/')
+
+
 def normalize_phone(phone: str) -> Optional[str]:
     """Normalize phone number: strip non-digits, keep 10 or 11 digits (11 if starts with 1)."""
     if not phone:
         return None
     
-    digits = re.sub(r'\D', '', phone)
+    digits = NON_DIGIT_RE.sub('', phone)
     
     if len(digits) == 10:
         return digits
@@ -62,22 +146,24 @@ def normalize_phone(phone: str) -> Optional[str]:
     return None
 
 
-def parse_json_ld(soup: BeautifulSoup) -> Dict:
-    """Parse all <script type="application/ld+json"> blocks."""
+def parse_json_ld(soup: Optional[BeautifulSoup], script_texts: Optional[List[str]] = None) -> Dict:
+    """Parse all <script type="application/ld+json"> blocks, or their already-read texts when given."""
     result = {
         'address': None,
         'telephone': None,
         'name': None
     }
     
-    json_ld_scripts = soup.find_all('script', type='application/ld+json')
+    if script_texts is None:
+        script_texts = [script.string for script in soup.find_all('script', type='application/ld+json')]
     
-    for script in json_ld_scripts:
+    for content in script_texts:
         try:
-            import json
-            content = script.string
             if not content:
                 continue
+            # Blocks without any of the fields are skipped without being decoded
+            if not any(marker in content for marker in JSON_LD_FIELD_MARKERS):
+                continue
             
             data = json.loads(content)
             
@@ -115,6 +201,10 @@ def parse_json_ld(soup: BeautifulSoup) -> Dict:
             # Extract name
             if 'name' in data:
                 result['name'] = data['name']
+            
+            # All three fields filled - no need to decode the remaining blocks
+            if result['address'] and result['telephone'] and result['name']:
+                return result
                 
         except Exception as e:
             logger.debug(f"Error parsing JSON-LD: {e}")
@@ -134,8 +224,7 @@ def extract_phone_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[st
                     text = container.inner_text().strip()
                     if text:
                         # Extract phone from container
-                        phone_pattern = r'(?:\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}'
-                        matches = re.findall(phone_pattern, text)
+                        matches = PHONE_RE.findall(text)
                         for match in matches:
                             normalized = normalize_phone(match)
                             if normalized:
@@ -148,12 +237,11 @@ def extract_phone_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[st
     
     # Also try with BeautifulSoup
     if soup:
-        agent_info_containers = soup.find_all(class_=re.compile(r'ds-listing-agent-info'))
+        agent_info_containers = soup.find_all(class_=AGENT_INFO_CLASS_RE)
         for container in agent_info_containers:
             text = container.get_text(strip=True)
             if text:
-                phone_pattern = r'(?:\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}'
-                matches = re.findall(phone_pattern, text)
+                matches = PHONE_RE.findall(text)
                 for match in matches:
                     normalized = normalize_phone(match)
                     if normalized:
@@ -169,8 +257,7 @@ def extract_phone_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[st
                     text = elem.inner_text().strip()
                     if text:
                         # Extract phone from text
-                        phone_pattern = r'(?:\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}'
-                        matches = re.findall(phone_pattern, text)
+                        matches = PHONE_RE.findall(text)
                         for match in matches:
                             normalized = normalize_phone(match)
                             if normalized:
@@ -187,8 +274,7 @@ def extract_phone_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[st
         for elem in agent_info_elements:
             text = elem.get_text(strip=True)
             if text:
-                phone_pattern = r'(?:\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}'
-                matches = re.findall(phone_pattern, text)
+                matches = PHONE_RE.findall(text)
                 for match in matches:
                     normalized = normalize_phone(match)
                     if normalized:
@@ -212,7 +298,7 @@ def extract_phone_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[st
         pass
     
     if soup:
-        tel_links = soup.find_all('a', href=re.compile(r'^tel:'))
+        tel_links = soup.find_all('a', href=TEL_HREF_RE)
         for link in tel_links:
             href = link.get('href', '')
             phone = href.replace('tel:', '').replace('+1', '').strip()
@@ -238,8 +324,7 @@ def extract_phone_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[st
                         if elem.is_visible():
                             text = elem.inner_text()
                             if text:
-                                phone_pattern = r'(?:\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}'
-                                matches = re.findall(phone_pattern, text)
+                                matches = PHONE_RE.findall(text)
                                 for match in matches:
                                     normalized = normalize_phone(match)
                                     if normalized:
@@ -267,8 +352,7 @@ def extract_phone_from_regex(page: Page, soup: BeautifulSoup) -> Optional[str]:
     if not page_text:
         return None
     
-    phone_pattern = r'(?:\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}'
-    matches = re.findall(phone_pattern, page_text)
+    matches = PHONE_RE.findall(page_text)
     
     for match in matches:
         normalized = normalize_phone(match)
@@ -292,8 +376,7 @@ def extract_agent_business_phone_from_card(page: Page, soup: BeautifulSoup) -> t
                 if container.is_visible():
                     # Extract phone from container text
                     container_text = container.inner_text()
-                    phone_pattern = r'(?:\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}'
-                    phone_matches = re.findall(phone_pattern, container_text)
+                    phone_matches = PHONE_RE.findall(container_text)
                     
                     phone = None
                     for match in phone_matches:
@@ -364,6 +447,7 @@ def extract_phone(page: Page, soup: BeautifulSoup) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_address(address: str) -> str:
     """Normalize address: title case, collapse whitespace."""
     if not address:
@@ -374,10 +458,9 @@ def normalize_address(address: str) -> str:
     words = address.split()
     normalized_words = []
     for word in words:
-        if word.upper() in ['ST', 'AVE', 'RD', 'BLVD', 'LN', 'CT', 'DR', 'WAY', 'PL', 'PKWY']:
-            normalized_words.append(word.upper())
-        elif word.upper() in ['N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW']:
-            normalized_words.append(word.upper())
+        upper = word.upper()
+        if upper in _STREET_SUFFIXES or upper in _DIR_ABBREV:
+            normalized_words.append(upper)
         else:
             normalized_words.append(word.title())
     
@@ -395,13 +478,13 @@ def extract_address_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[
                 return addr
         
         # Also check for Text-c11n class in soup
-        text_elem = soup.find(class_=re.compile(r'Text-c11n.*sc-aiai24.*cEHZrB|cEHZrB'))
+        text_elem = soup.find(class_=ADDRESS_TEXT_CLASS_RE)
         if not text_elem:
-            text_elem = soup.find(class_=re.compile(r'cEHZrB'))
+            text_elem = soup.find(class_=ADDRESS_FALLBACK_CLASS_RE)
         if text_elem:
             text = text_elem.get_text(strip=True)
             if text and len(text) > 10 and len(text) < 200:
-                if re.search(r'^\d+', text):
+                if LEADING_NUMBER_RE.search(text):
                     lines = text.split('\n')
                     addr = lines[0].split(',')[0].strip()
                     if addr and not any(word in addr.lower() for word in ['photos', 'accepts', 'zillow', 'appl']):
@@ -435,7 +518,7 @@ def extract_address_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[
             text = text_elem.inner_text().strip()
             if text and len(text) > 10 and len(text) < 200:
                 # Must start with a number (street address)
-                if re.search(r'^\d+', text):
+                if LEADING_NUMBER_RE.search(text):
                     lines = text.split('\n')
                     addr = lines[0].split(',')[0].strip()
                     # Exclude if it contains UI text
@@ -470,7 +553,7 @@ def extract_address_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[
                 text = elem.inner_text().strip()
                 if text and len(text) > 10 and len(text) < 200:
                     # Must start with a number (street address)
-                    if re.search(r'^\d+', text):
+                    if LEADING_NUMBER_RE.search(text):
                         lines = text.split('\n')
                         addr = lines[0].split(',')[0].strip()
                         # Exclude if it contains UI text
@@ -486,7 +569,7 @@ def extract_address_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[
             text = h1_elem.inner_text().strip()
             if text and len(text) > 10 and len(text) < 200:
                 # Must start with a number and not contain UI words
-                if (re.search(r'^\d+', text) and 
+                if (LEADING_NUMBER_RE.search(text) and 
                     not any(word in text.lower() for word in ['photos', 'accepts', 'zillow', 'appl', 'verified'])):
                     lines = text.split('\n')
                     addr = lines[0].split(',')[0].strip()
@@ -507,7 +590,7 @@ def extract_address_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[
                     if lines:
                         addr = lines[0].split(',')[0].strip()
                         # Must start with number and not contain UI words
-                        if (addr and re.search(r'^\d+', addr) and 
+                        if (addr and LEADING_NUMBER_RE.search(addr) and 
                             not any(word in addr.lower() for word in ui_words)):
                             return addr
             except Exception:
@@ -524,7 +607,7 @@ def extract_address_from_selectors(page: Page, soup: BeautifulSoup) -> Optional[
                 if lines:
                     addr = lines[0].split(',')[0].strip()
                     # Must start with number and not contain UI words
-                    if (addr and re.search(r'^\d+', addr) and 
+                    if (addr and LEADING_NUMBER_RE.search(addr) and 
                         not any(word in addr.lower() for word in ui_words)):
                         return addr
     
@@ -548,8 +631,7 @@ def extract_address_from_regex(page: Page, soup: BeautifulSoup) -> Optional[str]
     ui_words = ['photos', 'accepts', 'zillow', 'appl', 'verified', 'source', 'manage', 'rentals', 
                 'advertise', 'contacts', 'list', 'criteria', 'sets', 'property manager']
     
-    street_pattern = r'\d+\s+[A-Za-z0-9\s]+(?:St|Street|Ave|Avenue|Rd|Road|Dr|Drive|Blvd|Boulevard|Ln|Lane|Ct|Court|Way|Pl|Place|Pkwy|Parkway)'
-    matches = re.findall(street_pattern, page_text, re.IGNORECASE)
+    matches = STREET_RE.findall(page_text)
     for match in matches:
         addr = match.strip()
         addr = ' '.join(addr.split())
@@ -557,12 +639,45 @@ def extract_address_from_regex(page: Page, soup: BeautifulSoup) -> Optional[str]
         if not any(word in addr.lower() for word in ui_words):
             # Must be reasonable length (not too short, not too long)
             # Must look like a real address (has street suffix)
-            if 10 <= len(addr) <= 100 and re.search(r'(?:St|Street|Ave|Avenue|Rd|Road|Dr|Drive|Blvd|Boulevard|Ln|Lane|Ct|Court|Way|Pl|Place|Pkwy|Parkway)', addr, re.IGNORECASE):
+            if 10 <= len(addr) <= 100 and STREET_SUFFIX_RE.search(addr):
                 return addr
     
     return None
 
 
+def quick_listing_fields(page: Page) -> Optional[Dict[str, str]]:
+    """
+    Phone, agent/business name and address from the listing card, JSON-LD and streetAddress meta, read in one evaluate.
+    Returns None unless a phone, an address and at least one name are found; the caller then falls back to the full parse.
+    """
+    try:
+        quick = page.evaluate(QUICK_FIELDS_JS)
+    except Exception as e:
+        logger.debug(f"Quick field read failed: {e}")
+        return None
+    
+    phone = None
+    for match in PHONE_RE.findall(quick['card'] or ''):
+        phone = normalize_phone(match)
+        if phone:
+            break
+    if not phone:
+        return None
+    
+    agent_name = clean_manager_name(quick['agentName'].strip()) if quick['agentName'] else ''
+    business_name = clean_manager_name(quick['businessName'].strip()) if quick['businessName'] else ''
+    address = parse_json_ld(None, quick['jsonLd']).get('address') or (quick['streetAddress'] or '').strip()
+    if not address or not (agent_name or business_name):
+        return None
+    
+    return {
+        'phone': phone,
+        'address': normalize_address(address),
+        'agent_name': agent_name or '',
+        'business_name': business_name or ''
+    }
+
+
 def extract_address(page: Page, soup: BeautifulSoup) -> Optional[str]:
     """Extract address using JSON-LD → selectors → regex fallback order."""
     # Method 1: JSON-LD
@@ -607,7 +722,7 @@ def extract_manager_name_from_selectors(page: Page, soup: BeautifulSoup) -> Opti
     
     # Also try with BeautifulSoup
     if soup:
-        business_name_elems = soup.find_all(class_=re.compile(r'ds-listing-agent-business-name'))
+        business_name_elems = soup.find_all(class_=BUSINESS_NAME_CLASS_RE)
         for elem in business_name_elems:
             business_name = elem.get_text(strip=True)
             if business_name and len(business_name) >= 3 and len(business_name) <= 80:
@@ -923,10 +1038,16 @@ def extract_manager_name(page: Page, soup: BeautifulSoup) -> Optional[str]:
     return None
 
 
+class PageBlockedError(Exception):
+    """Zillow served an access-denied / bot-check page instead of the property."""
+
+
 def scrape_property_url(page: Page, url: str, store: Store) -> Optional[Dict]:
     """
     Scrape a single Zillow property URL and extract data.
     Returns dict with phone, address, manager_name, or None if failed.
+    Does not mark the URL crawled - the caller records it through the ListingWriter once the result is saved.
+    Raises PageBlockedError if the page is blocked, so it can be retried.
     """
     normalized_url = normalize_url(url)
     
@@ -940,12 +1061,15 @@ def scrape_property_url(page: Page, url: str, store: Store) -> Optional[Dict]:
         page.goto(url, wait_until='domcontentloaded', timeout=60000)
         time.sleep(random.uniform(2.0, 3.5))
         
+        # page.url is local, so this costs no round-trip; host and tracking params are ignored
+        if not same_listing_path(page.url, url):
+            logger.warning(f"  Redirected away from listing: {page.url}")
+        
         # Check if blocked
         page_title = page.title()
-        if 'denied' in page_title.lower() or 'blocked' in page_title.lower():
+        if BLOCKED_TITLE_RE.search(page_title):
             logger.warning(f"  ⚠️  Page blocked: {url}")
-            store.mark_url_crawled(normalized_url)
-            return None
+            raise PageBlockedError(url)
         
         # Wait for page to load
         try:
@@ -953,8 +1077,14 @@ def scrape_property_url(page: Page, url: str, store: Store) -> Optional[Dict]:
         except Exception:
             pass
         
+        # Most listings have everything in the agent card - skip page.content() and the soup entirely
+        data = quick_listing_fields(page)
+        if data:
+            logger.info(f"  ✅ Extracted: phone={data['phone']}, address={data['address']}, agent={data['agent_name'] or 'None'}, business={data['business_name'] or 'None'}")
+            return data
+        
         html = page.content()
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, SOUP_PARSER)
         
         # Extract phone, agent name, and business name from card (most reliable)
         agent_name, business_name, phone = extract_agent_business_phone_from_card(page, soup)
@@ -964,7 +1094,6 @@ def scrape_property_url(page: Page, url: str, store: Store) -> Optional[Dict]:
             phone = extract_phone(page, soup)
             if not phone:
                 logger.warning(f"  ❌ No phone found for {url}")
-                store.mark_url_crawled(normalized_url)
                 return None
         
         # If no agent/business name from card, try other methods
@@ -985,9 +1114,6 @@ def scrape_property_url(page: Page, url: str, store: Store) -> Optional[Dict]:
         # Extract address (best-effort)
         address = extract_address(page, soup)
         
-        # Mark URL as crawled
-        store.mark_url_crawled(normalized_url)
-        
         # Log extraction results
         agent_display = agent_name if agent_name else 'None'
         business_display = business_name if business_name else 'None'
@@ -1000,9 +1126,10 @@ def scrape_property_url(page: Page, url: str, store: Store) -> Optional[Dict]:
             'business_name': business_name or ''  # Empty string if no business name found
         }
         
+    except PageBlockedError:
+        raise
     except Exception as e:
         logger.error(f"Error scraping {url}: {e}")
-        store.mark_url_crawled(normalized_url)
         return None
 
 
@@ -1010,55 +1137,191 @@ def export_to_csv(store: Store, output_path: str):
     """Export aggregated data to CSV."""
     logger.info("Exporting data to CSV...")
     
-    phones_data = store.get_all_phones()
+    # Phones are aggregated and sorted by phone in SQL, streamed row by row
+    rows = store.export_rows()
+    first_row = next(rows, None)
     
-    if not phones_data:
+    if first_row is None:
         logger.warning("No data to export")
         return
     
-    records = []
-    for data in phones_data:
-        addresses_str = '; '.join(sorted(data['addresses'])) if data['addresses'] else ''
-        
-        records.append({
-            'phone': data['phone'],
-            'agent_name': data.get('agent_name', '') or '',
-            'business_name': data.get('business_name', '') or '',
-            'addresses': addresses_str,
-            'units': data['units']
-        })
-    
-    df = pd.DataFrame(records)
-    df = df.sort_values(by='phone').reset_index(drop=True)
-    
-    df.to_csv(output_path, index=False)
-    logger.info(f"Exported {len(records)} records to {output_path}")
+    record_count = 0
+    total_addresses = 0
+    preview = []
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        for row in itertools.chain([first_row], rows):
+            record = (row['phone'], row['agent_name'], row['business_name'], row['addresses'], row['units'])
+            writer.writerow(record)
+            record_count += 1
+            total_addresses += row['units']
+            if len(preview) < 5:
+                preview.append(record)
+    logger.info(f"Exported {record_count} records to {output_path}")
     
     print("\n" + "=" * 80)
     print("SCRAPING SUMMARY")
     print("=" * 80)
-    print(f"Unique phones found: {len(records)}")
-    
-    total_addresses = sum(len(data['addresses']) for data in phones_data)
+    print(f"Unique phones found: {record_count}")
     print(f"Total addresses aggregated: {total_addresses}")
     
     print("\nPreview (first 5 rows):")
     print("-" * 80)
-    print(df.head(5).to_string(index=False))
+    print("  ".join(CSV_COLUMNS))
+    for record in preview:
+        print("  ".join(str(value) for value in record))
     print("=" * 80)
 
 
-def scrape_from_urls(input_csv: str, output_csv: str, delay: float, headless: bool = False):
-    """Read URLs from CSV and scrape data from each."""
+def new_browser_context(browser, storage_state: Optional[str] = None, proxy: Optional[str] = None):
+    """
+    Create a browser context with the scraper's fingerprint, stealth script and request blocking.
+    Starts from the session saved at storage_state and routes through proxy when given.
+    """
+    context = browser.new_context(
+        storage_state=storage_state,
+        proxy={'server': proxy} if proxy else None,
+        user_agent=USER_AGENT,
+        viewport={'width': 1920, 'height': 1080},
+        locale='en-US',
+        timezone_id='America/New_York',
+        permissions=['geolocation'],
+        geolocation={'latitude': 33.7490, 'longitude': -84.3880},  # Atlanta coordinates
+        color_scheme='light',
+    )
+    
+    # Add comprehensive stealth scripts to avoid detection
+    context.add_init_script(path=STEALTH_JS_PATH)
+    
+    # Photos, map tiles and analytics don't feed the extractors
+    context.route('**/*', block_unneeded_requests)
+    return context
+
+
+class ListingWriterError(RuntimeError):
+    """The background writer thread stopped; listings queued after that were not saved."""
+
+
+class ListingWriter:
+    """
+    Saves scraped listings on a background thread, so store writes and CSV exports overlap the next page load.
+    The thread's Store connection is the only one that writes: each URL is marked crawled there, after its listing
+    is saved. The CSV is re-exported every EXPORT_EVERY_PHONES new phones or EXPORT_INTERVAL seconds.
+    """
+    
+    def __init__(self, db_path: str, output_csv: str):
+        self.db_path = db_path
+        self.output_csv = output_csv
+        self._queue = queue.Queue()
+        # Whatever stopped the thread, re-raised by put() and close()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name='listing-writer', daemon=True)
+        self._thread.start()
+    
+    def put(self, url: str, data: Optional[Dict]):
+        """
+        Queue one scraped URL for saving, with its listing or None if nothing was found; never blocks the scrape loop.
+        Raises ListingWriterError if the writer thread has stopped.
+        """
+        self._check_alive()
+        self._queue.put((url, data))
+    
+    def close(self):
+        """Save everything still queued, then stop the thread. Raises ListingWriterError if the thread failed."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self._error is not None:
+            raise ListingWriterError(f"Listing writer failed: {self._error}") from self._error
+    
+    def _check_alive(self):
+        if not self._thread.is_alive():
+            raise ListingWriterError(f"Listing writer stopped: {self._error}") from self._error
+    
+    def _run(self):
+        store = None
+        try:
+            store = Store(self.db_path)
+            # Phone count and time of the last incremental CSV export
+            last_export_count = store.get_unique_phones_count()
+            last_export_time = time.monotonic()
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                url, data = item
+                if not data:
+                    store.mark_url_crawled(url)
+                    continue
+                try:
+                    store.upsert_phone(data['phone'], data.get('agent_name', ''), data.get('business_name', ''))
+                    if data['address']:
+                        store.add_address(data['phone'], data['address'])
+                    # Only a saved listing counts as crawled; a failed save is revisited on the next run
+                    store.mark_url_crawled(url)
+                    
+                    phones_count = store.get_unique_phones_count()
+                    logger.info(f"Progress: {phones_count} unique phones")
+                    
+                    # Export to CSV incrementally, every EXPORT_EVERY_PHONES new phones or EXPORT_INTERVAL seconds
+                    new_phones = phones_count - last_export_count
+                    if new_phones >= EXPORT_EVERY_PHONES or (new_phones and time.monotonic() - last_export_time >= EXPORT_INTERVAL):
+                        try:
+                            export_to_csv(store, self.output_csv)
+                        except Exception as e:
+                            logger.debug(f"Could not export CSV incrementally: {e}")
+                        last_export_count = phones_count
+                        last_export_time = time.monotonic()
+                except Exception as e:
+                    logger.error(f"Error saving listing {data.get('phone')}: {e}")
+        except BaseException as e:
+            logger.error(f"Listing writer stopped: {e}", exc_info=True)
+            self._error = e
+        finally:
+            if store is not None:
+                store.close()
+
+
+def block_unneeded_requests(route):
+    """Abort asset and analytics requests; let everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(keyword in request.url for keyword in BLOCKED_URL_KEYWORDS):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def save_storage_state(context, storage_state: str):
+    """Persist cookies and localStorage so the next run starts with a warm session."""
+    try:
+        os.makedirs(os.path.dirname(storage_state) or '.', exist_ok=True)
+        context.storage_state(path=storage_state)
+        logger.info(f"💾 Saved browser session to {storage_state}")
+    except Exception as e:
+        logger.warning(f"Error saving browser session: {e}")
+
+
+def scrape_from_urls(input_csv: str, output_csv: str, delay: float, headless: bool = False, storage_state: str = STORAGE_STATE_PATH, proxies: Optional[List[str]] = None):
+    """
+    Read URLs from CSV and scrape data from each.
+    A session saved at storage_state is reused and saved again when the run ends.
+    Blocked URLs are retried with exponential backoff; with proxies, each block also moves
+    the browser to a fresh context on the next proxy.
+    """
     # Read URLs from input CSV
     urls = []
+    seen_urls = set()  # normalized, so a listing repeated in the CSV is scraped once
     try:
         with open(input_csv, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
                 url = row.get('url', '').strip()
                 if url and url.startswith('http'):
-                    urls.append(url)
+                    normalized = normalize_url(url)
+                    if normalized not in seen_urls:
+                        seen_urls.add(normalized)
+                        urls.append(url)
     except Exception as e:
         logger.error(f"Error reading input CSV {input_csv}: {e}")
         return
@@ -1071,6 +1334,7 @@ def scrape_from_urls(input_csv: str, output_csv: str, delay: float, headless: bo
     logger.info(f"Total URLs to scrape: {len(urls)}")
     logger.info(f"Delay: {delay}s (±0.6s jitter)")
     logger.info(f"Headless: {headless}")
+    logger.info(f"Proxies: {len(proxies) if proxies else 'None'}")
     logger.info("=" * 80)
     
     # Initialize store
@@ -1092,126 +1356,88 @@ def scrape_from_urls(input_csv: str, output_csv: str, delay: float, headless: bo
                     '--disable-dev-shm-usage',
                     '--no-sandbox',
                     '--disable-setuid-sandbox',
-                ]
+                    '--disable-gpu',
+                    '--disable-background-networking',
+                    '--disable-features=Translate,BackForwardCache',
+                    '--blink-settings=imagesEnabled=false',  # Skip image decoding entirely
+                ],
+                # Proxies are set per context so they can be rotated; Chromium needs this placeholder at launch
+                proxy={'server': 'http://per-context'} if proxies else None,
             )
+            proxy_cycle = itertools.cycle(proxies) if proxies else None
             
-            context = browser.new_context(
-                user_agent=USER_AGENT,
-                viewport={'width': 1920, 'height': 1080},
-                locale='en-US',
-                timezone_id='America/New_York',
-                permissions=['geolocation'],
-                geolocation={'latitude': 33.7490, 'longitude': -84.3880},  # Atlanta coordinates
-                color_scheme='light',
-            )
-            
-            # Add comprehensive stealth scripts to avoid detection
-            context.add_init_script("""
-                // Remove webdriver property
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                
-                // Override plugins to look like real Chrome
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => {
-                        const plugins = [];
-                        for (let i = 0; i < 5; i++) {
-                            plugins.push({
-                                0: {type: 'application/x-google-chrome-pdf', suffixes: 'pdf', description: 'Portable Document Format'},
-                                description: 'Portable Document Format',
-                                filename: 'internal-pdf-viewer',
-                                length: 1,
-                                name: 'Chrome PDF Plugin'
-                            });
-                        }
-                        return plugins;
-                    }
-                });
-                
-                // Override languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-                
-                // Chrome runtime (make it look like real Chrome)
-                window.chrome = {
-                    runtime: {},
-                    loadTimes: function() {},
-                    csi: function() {},
-                    app: {}
-                };
-                
-                // Override permissions API
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-                
-                // Override getBattery to return realistic values
-                if (navigator.getBattery) {
-                    navigator.getBattery = () => Promise.resolve({
-                        charging: true,
-                        chargingTime: 0,
-                        dischargingTime: Infinity,
-                        level: 1
-                    });
-                }
-                
-                // Override platform
-                Object.defineProperty(navigator, 'platform', {
-                    get: () => 'Win32'
-                });
-                
-                // Add missing properties that real Chrome has
-                Object.defineProperty(navigator, 'hardwareConcurrency', {
-                    get: () => 8
-                });
-                
-                Object.defineProperty(navigator, 'deviceMemory', {
-                    get: () => 8
-                });
-            """)
+            # Reuse a saved session (cookies, bot-check clearance) if there is one
+            has_saved_session = bool(storage_state) and os.path.exists(storage_state)
+            if has_saved_session:
+                logger.info(f"Reusing saved browser session from {storage_state}")
             
+            context = new_browser_context(
+                browser,
+                storage_state if has_saved_session else None,
+                next(proxy_cycle) if proxy_cycle else None,
+            )
             page = context.new_page()
+            # Set once the original context is swapped for a fresh one on another proxy
+            rotated = False
+            # Scraped listings are saved on a background thread while the next page loads
+            writer = ListingWriter(store.db_path, output_csv)
+            
+            # URLs not yet visited, and a heap of blocked URLs waiting to be retried: (retry_at, url, attempts)
+            pending = collections.deque(urls)
+            retry_heap = []
+            visited = 0
             
             try:
-                for i, url in enumerate(urls, 1):
+                while pending or retry_heap:
+                    # A retry whose backoff has passed goes first, then new URLs, then the earliest retry
+                    if pending and not (retry_heap and retry_heap[0][0] <= time.time()):
+                        url = pending.popleft()
+                        attempts = 0
+                        visited += 1
+                        label = f"{visited}/{len(urls)}"
+                    else:
+                        retry_at, url, attempts = heapq.heappop(retry_heap)
+                        time.sleep(max(0.0, retry_at - time.time()))
+                        label = f"retry {attempts + 1}/{MAX_BLOCK_ATTEMPTS}"
+                    
                     logger.info(f"\n{'='*80}")
-                    logger.info(f"Scraping {i}/{len(urls)}: {url}")
+                    logger.info(f"Scraping {label}: {url}")
                     logger.info(f"{'='*80}")
                     
-                    data = scrape_property_url(page, url, store)
-                    
-                    if data:
-                        phone = data['phone']
-                        address = data['address']
-                        agent_name = data.get('agent_name', '')
-                        business_name = data.get('business_name', '')
-                        
-                        store.upsert_phone(phone, agent_name, business_name)
-                        
-                        if address:
-                            store.add_address(phone, address)
-                        
-                        logger.info(f"Progress: {store.get_unique_phones_count()} unique phones")
+                    try:
+                        data = scrape_property_url(page, url, store)
+                    except PageBlockedError:
+                        attempts += 1
+                        if attempts < MAX_BLOCK_ATTEMPTS:
+                            backoff = 2 ** attempts + random.random()
+                            logger.info(f"  Retrying in {backoff:.1f}s")
+                            heapq.heappush(retry_heap, (time.time() + backoff, url, attempts))
+                        else:
+                            logger.warning(f"  Giving up on {url} after {attempts} blocked attempts")
+                            writer.put(normalize_url(url), None)
                         
-                        # Export to CSV incrementally
-                        try:
-                            export_to_csv(store, output_csv)
-                        except Exception as e:
-                            logger.debug(f"Could not export CSV incrementally: {e}")
+                        # Move to a fresh context on the next proxy; the blocked session is not kept
+                        if proxy_cycle:
+                            rotated = True
+                            context.close()
+                            context = new_browser_context(browser, None, next(proxy_cycle))
+                            page = context.new_page()
+                    else:
+                        writer.put(normalize_url(url), data)
                     
                     # Rate limiting
-                    if i < len(urls):
+                    if pending or retry_heap:
                         jitter = random.uniform(-0.6, 0.6)
                         wait_time = max(0.1, delay + jitter)
                         time.sleep(wait_time)
                 
             finally:
+                # A rotated context is cold and was just blocked - keep the saved session instead
+                if storage_state and not rotated:
+                    save_storage_state(context, storage_state)
                 browser.close()
+                # Let the writer save everything queued before the final export; raises if it failed
+                writer.close()
         
         # Final export
         export_to_csv(store, output_csv)
@@ -1234,6 +1460,8 @@ def main():
     parser.add_argument('--output', type=str, default='data/zillow_sfr.csv', help='Output CSV file (default: data/zillow_sfr.csv)')
     parser.add_argument('--delay', type=float, default=3.0, help='Delay between requests in seconds (default: 3.0)')
     parser.add_argument('--headless', action='store_true', help='Run browser in headless mode')
+    parser.add_argument('--proxies', type=str, default='', help='Comma-separated proxy servers, rotated whenever a page is blocked (default: none)')
+    parser.add_argument('--storage_state', type=str, default=STORAGE_STATE_PATH, help=f'Browser session file reused between runs; pass "" to disable (default: {STORAGE_STATE_PATH})')
     
     args = parser.parse_args()
     
@@ -1245,7 +1473,9 @@ def main():
         input_csv=args.input,
         output_csv=args.output,
         delay=args.delay,
-        headless=args.headless
+        headless=args.headless,
+        storage_state=args.storage_state,
+        proxies=[proxy.strip() for proxy in args.proxies.split(',') if proxy.strip()]
     )
 
 
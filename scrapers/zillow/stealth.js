@@ -0,0 +1,68 @@
+// Init script added to every Zillow browser context to hide automation fingerprints.
+// Shared by collect_urls.py and scrape_from_urls.py.
+// Remove webdriver property
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined
+});
+
+// Override plugins to look like real Chrome
+Object.defineProperty(navigator, 'plugins', {
+    get: () => {
+        const plugins = [];
+        for (let i = 0; i < 5; i++) {
+            plugins.push({
+                0: {type: 'application/x-google-chrome-pdf', suffixes: 'pdf', description: 'Portable Document Format'},
+                description: 'Portable Document Format',
+                filename: 'internal-pdf-viewer',
+                length: 1,
+                name: 'Chrome PDF Plugin'
+            });
+        }
+        return plugins;
+    }
+});
+
+// Override languages
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-US', 'en']
+});
+
+// Chrome runtime (make it look like real Chrome)
+window.chrome = {
+    runtime: {},
+    loadTimes: function() {},
+    csi: function() {},
+    app: {}
+};
+
+// Override permissions API
+const originalQuery = window.navigator.permissions.query;
+window.navigator.permissions.query = (parameters) => (
+    parameters.name === 'notifications' ?
+        Promise.resolve({ state: Notification.permission }) :
+        originalQuery(parameters)
+);
+
+// Override getBattery to return realistic values
+if (navigator.getBattery) {
+    navigator.getBattery = () => Promise.resolve({
+        charging: true,
+        chargingTime: 0,
+        dischargingTime: Infinity,
+        level: 1
+    });
+}
+
+// Override platform
+Object.defineProperty(navigator, 'platform', {
+    get: () => 'Win32'
+});
+
+// Add missing properties that real Chrome has
+Object.defineProperty(navigator, 'hardwareConcurrency', {
+    get: () => 8
+});
+
+Object.defineProperty(navigator, 'deviceMemory', {
+    get: () => 8
+});
@@ -3,7 +3,7 @@ SQLite database helpers for persistent storage and checkpointing.
 """
 import sqlite3
 import logging
-from typing import Optional, List, Set
+from typing import Optional, List, Set, Iterator
 from urllib.parse import urlparse, parse_qs, urlunparse
 
 logger = logging.getLogger(__name__)
@@ -234,6 +234,31 @@ class Store:
         
         return results
     
+    def export_rows(self) -> Iterator[dict]:
+        """
+        Stream one aggregated row per phone, ordered by phone.
+        Rows have keys: phone, agent_name, business_name, addresses ('; '-joined, sorted), units (int)
+        """
+        cursor = self.conn.cursor()
+        # GROUP_CONCAT order is arbitrary in SQLite, so addresses are joined on a separator
+        # that can't appear in them and sorted per row for a deterministic order
+        cursor.execute("""
+            SELECT p.phone AS phone,
+                   COALESCE(p.agent_name, '') AS agent_name,
+                   COALESCE(p.business_name, '') AS business_name,
+                   COALESCE(GROUP_CONCAT(a.address, char(31)), '') AS addresses,
+                   COUNT(a.address) AS units
+            FROM phones p
+            LEFT JOIN addresses a ON a.phone = p.phone
+            GROUP BY p.phone
+            ORDER BY p.phone
+        """)
+        for row in cursor:
+            record = dict(row)
+            if record['addresses']:
+                record['addresses'] = '; '.join(sorted(record['addresses'].split('\x1f')))
+            yield record
+    
     def close(self):
         """Close database connection."""
         if self.conn:
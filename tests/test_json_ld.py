@@ -0,0 +1,59 @@
+"""
+Regression checks for JSON-LD parsing in the apartments scraper.
+Run from the repo root: python -m pytest tests
+"""
+import pytest
+
+pytest.importorskip('orjson')
+pytest.importorskip('playwright')
+
+from scrapers.apartments.scraper import iter_json_ld_objects, json_ld_script_texts, parse_json_ld
+
+DETAIL_HTML = """
+<html><head>
+<script type="application/ld+json">
+{"@type": "ApartmentComplex", "name": "Acme Homes",
+ "telephone": "(404) 555-0123",
+ "address": {"streetAddress": "12 Main St", "addressLocality": "Atlanta", "addressRegion": "GA", "postalCode": "30301"}}
+</script>
+</head><body></body></html>
+"""
+
+SEARCH_HTML = """
+<html><head>
+<script type="application/ld+json">
+{"@type": "CollectionPage", "mainEntity": {"@type": "ItemList", "itemListElement": [
+  {"item": {"url": "https://www.apartments.com/12-main-st-atlanta-ga/abc123/"}}]}}
+</script>
+</head><body></body></html>
+"""
+
+
+class SubclassedText(str):
+    """Stands in for lxml's _ElementUnicodeResult and BeautifulSoup's NavigableString."""
+
+
+def test_parse_json_ld_detail_page():
+    data = parse_json_ld(DETAIL_HTML)
+    assert data['name'] == 'Acme Homes'
+    assert data['telephone'] == '(404) 555-0123'
+    assert data['address'] == '12 Main St, Atlanta, GA, 30301'
+
+
+def test_script_texts_are_plain_str():
+    texts = json_ld_script_texts(DETAIL_HTML)
+    assert texts and all(type(text) is str for text in texts)
+
+
+def test_iter_json_ld_objects_accepts_str_subclasses():
+    texts = [SubclassedText(text) for text in json_ld_script_texts(DETAIL_HTML)]
+    items = list(iter_json_ld_objects('', script_texts=texts))
+    assert items and items[0]['name'] == 'Acme Homes'
+
+
+def test_iter_json_ld_objects_search_page():
+    # get_listing_urls_from_search_page reads listing URLs from this CollectionPage/ItemList block
+    items = list(iter_json_ld_objects(SEARCH_HTML))
+    assert [item['@type'] for item in items] == ['CollectionPage']
+    urls = [entry['item']['url'] for entry in items[0]['mainEntity']['itemListElement']]
+    assert urls == ['https://www.apartments.com/12-main-st-atlanta-ga/abc123/']